@@ -0,0 +1,56 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+"""Compare `inspect.stack` against frame walking for caller capture at several depths."""
+
+from __future__ import annotations
+
+import timeit
+from inspect import getframeinfo, stack
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytools.logging._string_parse import caller, debug_str
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEPTHS = (5, 20, 50, 100)
+REPEAT = 2000
+
+
+def old_path() -> str:
+    tb = getframeinfo(stack()[1][0])
+    file = Path(*Path(tb.filename).parts[-3:])
+    return f"({file}:{tb.lineno}|{tb.function})"
+
+
+def new_path() -> str:
+    return debug_str(caller(1))
+
+
+def at_depth(depth: int, func: Callable[[], str]) -> Callable[[], str]:
+    if depth <= 1:
+        return func
+    inner = at_depth(depth - 1, func)
+
+    def call() -> str:
+        return inner()
+
+    return call
+
+
+def main() -> None:
+    print(f"{'depth':>6} {'inspect.stack':>16} {'caller':>16} {'speedup':>8}")
+    for depth in DEPTHS:
+        old = min(timeit.repeat(at_depth(depth, old_path), number=REPEAT // 10, repeat=3))
+        new = min(timeit.repeat(at_depth(depth, new_path), number=REPEAT, repeat=3))
+        old_us = 1e6 * old / (REPEAT // 10)
+        new_us = 1e6 * new / REPEAT
+        print(f"{depth:>6} {old_us:>13.2f} us {new_us:>13.2f} us {old_us / new_us:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
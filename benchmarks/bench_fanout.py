@@ -0,0 +1,79 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+"""Per-message cost of fanning a coloured record out to three file targets plus stdout."""
+
+from __future__ import annotations
+
+import io
+import timeit
+from typing import ClassVar
+
+from pytools.logging import BColors, IHandler, LogEnum
+from pytools.logging._handlers import dispatch, plain_text
+from pytools.logging._struct_logger import StructLogger
+
+N = 20000
+MESSAGE = (
+    f"[12:00:00|{BColors.OKGREEN}INFO{BColors.ENDC}]>>> step 1234 converged\r"
+    f"{{file: solver/core.py, function: iterate, line: 120, residual: 1.0e-9, iters: 12}}\n"
+)
+
+
+class MemoryHandler(IHandler):
+    """In-memory stand-in for `FileHandler`, so that only the CPU cost is measured."""
+
+    ansi: ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        self._f = io.StringIO()
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self.emit(plain_text(msg))
+
+    def emit(self, msg: str) -> None:
+        self._f.write(msg)
+
+    def flush(self) -> None: ...
+
+
+class StreamHandler(IHandler):
+    def __init__(self) -> None:
+        self._f = io.StringIO()
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self._f.write(msg)
+
+    def flush(self) -> None: ...
+
+
+def main() -> None:
+    handlers = [StreamHandler(), MemoryHandler(), MemoryHandler(), MemoryHandler()]
+
+    def per_handler() -> None:
+        for h in handlers:
+            h.log(MESSAGE)
+
+    def format_once() -> None:
+        dispatch(handlers, MESSAGE)
+
+    old = min(timeit.repeat(per_handler, number=N, repeat=3))
+    new = min(timeit.repeat(format_once, number=N, repeat=3))
+    print(f"per-handler filtering: {1e6 * old / N:8.2f} us/msg")
+    print(f"format-once dispatch:  {1e6 * new / N:8.2f} us/msg  ({old / new:.1f}x)")
+
+    logger = StructLogger(LogEnum.INFO, stdout=False)
+    for h in handlers:
+        logger.add_handler(h)
+    total = min(timeit.repeat(lambda: logger.info("step", residual=1e-9), number=N, repeat=3))
+    print(f"StructLogger.info end-to-end: {1e6 * total / N:8.2f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+"""Compare one future per item against chunked `ThreadedRunner.imap` for tiny tasks."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pytools.logging import get_logger
+from pytools.parallel import ThreadedRunner
+
+N = 100_000
+WORKERS = 4
+
+
+def tiny(x: int) -> int:
+    return x * x
+
+
+EXPECTED = sum(x * x for x in range(N))
+
+
+def per_item() -> float:
+    start = time.perf_counter()
+    with ProcessPoolExecutor(WORKERS) as exe:
+        results = [exe.submit(tiny, x) for x in range(N)]
+        total = sum(f.result() for f in results)
+    if total != EXPECTED:
+        raise RuntimeError
+    return time.perf_counter() - start
+
+
+def chunked() -> float:
+    start = time.perf_counter()
+    with ThreadedRunner(core=WORKERS) as runner:
+        total = sum(runner.imap(tiny, range(N)))
+    if total != EXPECTED:
+        raise RuntimeError
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    get_logger(level="WARN")
+    old = per_item()
+    new = chunked()
+    print(f"submit per item: {old:8.3f} s for {N} items")
+    print(f"imap, auto chunk: {new:8.3f} s  ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,47 @@
+from ._filters import Dedup, RateLimit, Sample
+from ._handlers import FileHandler, QueuedFileHandler
+from ._jsonl import JSONLHandler, iter_log_records
+from ._lazy import Lazy
 from ._logger import NLOGGER, get_logger
+from ._profile import (
+    ScopeStats,
+    profile_report,
+    profile_report_at_exit,
+    profile_stats,
+    reset_profile,
+    scope,
+    ship_profile,
+)
+from ._queue_logger import LogListener
+from ._rotating import RotatingFileHandler
 from ._timing import timeit
-from ._trait import BColors, IHandler, ILogger, LogEnum, LogLevel
+from ._trait import BColors, IHandler, ILogFilter, ILogger, LogEnum, LogLevel
 
 __all__ = [
     "NLOGGER",
     "BColors",
+    "Dedup",
+    "FileHandler",
     "IHandler",
+    "ILogFilter",
     "ILogger",
+    "JSONLHandler",
+    "Lazy",
     "LogEnum",
     "LogLevel",
+    "LogListener",
+    "QueuedFileHandler",
+    "RateLimit",
+    "RotatingFileHandler",
+    "Sample",
+    "ScopeStats",
     "get_logger",
+    "iter_log_records",
+    "profile_report",
+    "profile_report_at_exit",
+    "profile_stats",
+    "reset_profile",
+    "scope",
+    "ship_profile",
     "timeit",
 ]
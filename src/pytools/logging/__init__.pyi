@@ -2,8 +2,29 @@ from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Literal, overload
 
+from ._filters import Dedup as Dedup
+from ._filters import RateLimit as RateLimit
+from ._filters import Sample as Sample
+from ._handlers import FileHandler as FileHandler
+from ._handlers import OverflowPolicy as OverflowPolicy
+from ._handlers import QueuedFileHandler as QueuedFileHandler
+from ._jsonl import JSONLHandler as JSONLHandler
+from ._jsonl import RecordFormat as RecordFormat
+from ._jsonl import iter_log_records as iter_log_records
+from ._lazy import Lazy as Lazy
+from ._profile import ScopeStats as ScopeStats
+from ._profile import profile_report as profile_report
+from ._profile import profile_report_at_exit as profile_report_at_exit
+from ._profile import profile_stats as profile_stats
+from ._profile import reset_profile as reset_profile
+from ._profile import scope as scope
+from ._profile import ship_profile as ship_profile
+from ._queue_logger import LogListener as LogListener
+from ._rotating import Compression as Compression
+from ._rotating import RotatingFileHandler as RotatingFileHandler
 from ._trait import BColors as BColors
 from ._trait import IHandler as IHandler
+from ._trait import ILogFilter as ILogFilter
 from ._trait import ILogger as ILogger
 from ._trait import LogEnum as LogEnum
 from ._trait import LogLevel as LogLevel
@@ -33,6 +54,7 @@ def get_logger(
     console: bool = ...,
     file: Sequence[str | Path] | None = ...,
     logger: Literal["basic", "struct"] = ...,
+    queued: bool = ...,
 ) -> ILogger: ...
 @overload
 def get_logger(
@@ -42,6 +64,7 @@ def get_logger(
     console: bool = ...,
     file: Sequence[str | Path] | None = ...,
     logger: Literal["basic", "struct"] = ...,
+    queued: bool = ...,
 ) -> ILogger: ...
 @overload
 def get_logger(
@@ -51,5 +74,6 @@ def get_logger(
     console: bool = ...,
     file: Sequence[str | Path] | None = ...,
     logger: Literal["basic"] = ...,
+    queued: bool = ...,
 ) -> ILogger: ...
 def timeit[**P, R](f: Callable[P, R]) -> Callable[P, R]: ...
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import traceback
-from inspect import getframeinfo, stack
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, Literal, override
 
-from pytools.parsing import ppfmt
-
-from ._handlers import STDOUT_HANDLER, FileHandler
-from ._string_parse import cstr, debug_str, now
-from ._trait import BColors, IHandler, ILogger, LogEnum, LogLevel
+from ._filters import drain_filters, run_filters
+from ._handlers import STDOUT_HANDLER, FileHandler, QueuedFileHandler, dispatch
+from ._lazy import render
+from ._string_parse import caller, cstr, debug_str, now
+from ._trait import BColors, IHandler, ILogFilter, ILogger, LogEnum, LogLevel
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -19,10 +18,11 @@ _LOGGERS_DICT: Final[dict[str, ILogger]] = {}
 
 
 class BLogger(ILogger):
-    __slots__ = ["_handlers", "_header", "_level"]
+    __slots__ = ["_filters", "_handlers", "_header", "_level"]
     _level: LogEnum
     _handlers: dict[str, IHandler]
     _header: bool
+    _filters: list[ILogFilter]
 
     def __init__(
         self,
@@ -31,12 +31,15 @@ class BLogger(ILogger):
         header: bool = True,
         stdout: bool = True,
         files: Sequence[str | Path] | None = None,
+        queued: bool = False,
     ) -> None:
         self._level = level if isinstance(level, LogEnum) else LogEnum[level]
         self._header = header
+        self._filters = []
         self._handlers = {"STDOUT": STDOUT_HANDLER} if stdout else {}
         if files is not None:
-            self._handlers.update({str(f): FileHandler(f) for f in files})
+            handler = QueuedFileHandler if queued else FileHandler
+            self._handlers.update({str(f): handler(f) for f in files})
         for h in self._handlers.values():
             if self._level < LogEnum.BRIEF:
                 continue
@@ -81,6 +84,9 @@ class BLogger(ILogger):
             return
         del self._handlers["STDOUT"]
 
+    def is_enabled_for(self, level: LogEnum) -> bool:
+        return self._level <= level and bool(self._handlers)
+
     def add_handler(self, handler: IHandler | Path | str, *, name: str | None = None) -> None:
         if isinstance(handler, (str, Path)):
             handler = FileHandler(handler)
@@ -92,59 +98,81 @@ class BLogger(ILogger):
         if key in self._handlers:
             del self._handlers[key]
 
+    @property
+    def filters(self) -> Sequence[ILogFilter]:
+        return tuple(self._filters)
+
+    def add_filter(self, filt: ILogFilter) -> None:
+        self._filters.append(filt)
+
+    def remove_filter(self, filt: ILogFilter) -> None:
+        if filt in self._filters:
+            self._filters.remove(filt)
+
     def flush(self) -> None:
+        if self._filters and self._handlers:
+            for note in drain_filters(self._filters):
+                dispatch(self._handlers.values(), note)
         for h in self._handlers.values():
             h.flush()
 
     @override
     def log(self, *msg: object, level: LogEnum = LogEnum.BRIEF, **kwargs: object) -> None:
-        if len(msg) < 1:
+        if len(msg) < 1 or not self._handlers:
             return
+        if self._filters:
+            if (notes := run_filters(self._filters, msg, 2)) is None:
+                return
+            for note in notes:
+                dispatch(self._handlers.values(), note)
+        message = "\n".join([render(m) for m in msg]) + "\n"
         if self._header:
-            tb = getframeinfo(stack()[2][0])
-            header = f"\n[{now()}|{cstr(level)}]{debug_str(tb)}>>>\n"
-            for h in self._handlers.values():
-                h.log(header)
-        self.disp(*msg)
+            tb = caller(2)
+            message = f"\n[{now()}|{cstr(level)}]{debug_str(tb)}>>>\n" + message
+        dispatch(self._handlers.values(), message)
 
     @override
     def disp(
         self, *msg: object, end: Literal["\n", "\r", ""] = "\n", filt: LogEnum | None = None
     ) -> None:
-        if filt and self._level <= filt:
+        if (filt and self._level <= filt) or not self._handlers:
             return
-        message = "\n".join([ppfmt(m) for m in msg])
-        for h in self._handlers.values():
-            h.log(message + end)
+        if self._filters:
+            if (notes := run_filters(self._filters, msg, 1)) is None:
+                return
+            for note in notes:
+                dispatch(self._handlers.values(), note)
+        message = "\n".join([render(m) for m in msg])
+        dispatch(self._handlers.values(), message + end)
 
     @override
     def debug(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.DEBUG:
+        if self.is_enabled_for(LogEnum.DEBUG):
             self.log(*msg, level=LogEnum.DEBUG)
 
     @override
     def info(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.INFO:
+        if self.is_enabled_for(LogEnum.INFO):
             self.log(*msg, level=LogEnum.INFO)
 
     @override
     def brief(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.BRIEF:
+        if self.is_enabled_for(LogEnum.BRIEF):
             self.log(*msg, level=LogEnum.BRIEF)
 
     @override
     def warn(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.WARN:
+        if self.is_enabled_for(LogEnum.WARN):
             self.log(*msg, level=LogEnum.WARN)
 
     @override
     def error(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.ERROR:
+        if self.is_enabled_for(LogEnum.ERROR):
             self.log(*msg, level=LogEnum.ERROR)
 
     @override
     def fatal(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.FATAL:
+        if self.is_enabled_for(LogEnum.FATAL):
             self.log(*msg, level=LogEnum.FATAL)
 
     def exception(self, e: Exception) -> Exception:
@@ -152,4 +180,6 @@ class BLogger(ILogger):
         return e
 
     def close(self) -> None:
+        for h in self._handlers.values():
+            h.close()
         self._handlers.clear()
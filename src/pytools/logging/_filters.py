@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, Final, override
+
+from ._string_parse import call_site
+from ._trait import ILogFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from ._string_parse import Site
+
+__all__ = ["Dedup", "RateLimit", "Sample", "drain_filters", "run_filters", "unfiltered"]
+
+_LOCAL: Final = threading.local()
+_PLAIN: Final = (str, int, float, bool, type(None))
+
+
+class RateLimit(ILogFilter):
+    """Token bucket per call site.
+
+    Each site may log `burst` messages at once, after which it gets `rate` messages per
+    second.
+    """
+
+    __slots__ = ("_buckets", "burst", "rate")
+    rate: float
+    burst: float
+    _buckets: dict[Site, tuple[float, float]]
+
+    def __init__(self, rate: float, *, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            msg = f"rate and burst must be positive, got {rate} and {burst}"
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = float(burst)
+        self._buckets = {}
+
+    def __repr__(self) -> str:
+        return f"<RateLimit rate={self.rate}/s burst={self.burst:g}>"
+
+    @override
+    def allow(self, site: Site, msg: Sequence[object]) -> bool:
+        now = time.monotonic()
+        tokens, last = self._buckets.get(site, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1.0:
+            self._buckets[site] = (tokens, now)
+            return False
+        self._buckets[site] = (tokens - 1.0, now)
+        return True
+
+
+class Sample(ILogFilter):
+    """Let through the first and then every `n`-th message of each call site."""
+
+    __slots__ = ("_counts", "n")
+    n: int
+    _counts: dict[Site, int]
+
+    def __init__(self, n: int) -> None:
+        if n < 1:
+            msg = f"n must be positive, got {n}"
+            raise ValueError(msg)
+        self.n = n
+        self._counts = {}
+
+    def __repr__(self) -> str:
+        return f"<Sample 1/{self.n}>"
+
+    @override
+    def allow(self, site: Site, msg: Sequence[object]) -> bool:
+        count = self._counts.get(site, 0)
+        self._counts[site] = count + 1
+        return count % self.n == 0
+
+
+def _same(a: Sequence[object], b: Sequence[object]) -> bool:
+    # Only plain values are compared by value, so arrays and deferred messages are never
+    # evaluated here.
+    return len(a) == len(b) and all(
+        x is y or (type(x) is type(y) and isinstance(x, _PLAIN) and x == y)
+        for x, y in zip(a, b, strict=True)
+    )
+
+
+class Dedup(ILogFilter):
+    """Drop consecutive repeats of the same message from the same call site.
+
+    Once a different message comes through, or the logger is flushed, a note with the
+    number of dropped repeats is logged.
+    """
+
+    __slots__ = ("_last", "_notes", "_repeats")
+    _last: tuple[Site, Sequence[object]] | None
+    _repeats: int
+    _notes: list[str]
+
+    def __init__(self) -> None:
+        self._last = None
+        self._repeats = 0
+        self._notes = []
+
+    def __repr__(self) -> str:
+        return "<Dedup>"
+
+    def allow(self, site: Site, msg: Sequence[object]) -> bool:
+        last = self._last
+        if last is not None and last[0] == site and _same(last[1], msg):
+            self._repeats += 1
+            return False
+        self._summarize()
+        self._last = (site, msg)
+        return True
+
+    def drain(self) -> list[str]:
+        self._summarize()
+        notes, self._notes = self._notes, []
+        return notes
+
+    def _summarize(self) -> None:
+        if self._repeats == 0 or self._last is None:
+            return
+        file, lineno = self._last[0]
+        self._notes.append(
+            f"<<< Previous message ({file}:{lineno}) repeated {self._repeats} more times\n"
+        )
+        self._repeats = 0
+
+
+def run_filters(
+    filters: Sequence[ILogFilter], msg: Sequence[object], depth: int
+) -> list[str] | None:
+    """Apply `filters` to a log call `depth` frames above the caller.
+
+    Returns None if the call is suppressed, otherwise the notes to log before it.
+    """
+    if getattr(_LOCAL, "off", False):
+        return []
+    site = call_site(depth + 1)
+    if not all(f.allow(site, msg) for f in filters):
+        return None
+    return [note for f in filters for note in f.drain()]
+
+
+def drain_filters(filters: Sequence[ILogFilter]) -> list[str]:
+    return [note for f in filters for note in f.drain()]
+
+
+@contextlib.contextmanager
+def unfiltered() -> Generator[None]:
+    """Skip logger filters in this thread, e.g. for records already filtered by a worker."""
+    prev = getattr(_LOCAL, "off", False)
+    _LOCAL.off = True
+    try:
+        yield
+    finally:
+        _LOCAL.off = prev
@@ -3,15 +3,44 @@ from __future__ import annotations
 import os
 import sys
 import threading
+import time
+import weakref
+from collections import deque
 from pathlib import Path
-from typing import TextIO
+from typing import TYPE_CHECKING, ClassVar, Literal, TextIO
 
 from ._string_parse import filter_ansi, now
 from ._trait import IHandler
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type OverflowPolicy = Literal["block", "drop-oldest", "drop-newest"]
+
+
+def plain_text(msg: str) -> str:
+    return filter_ansi(msg).replace("\r", "\n")
+
+
+def dispatch(handlers: Iterable[IHandler], msg: str) -> None:
+    """Send one rendered message to every handler.
+
+    The ANSI-stripped variant is computed at most once, and only if some handler declares
+    `ansi = False`.
+    """
+    plain: str | None = None
+    for h in handlers:
+        if h.ansi:
+            h.emit(msg)
+            continue
+        if plain is None:
+            plain = plain_text(msg)
+        h.emit(plain)
+
 
 class FileHandler(IHandler):
     __slots__ = ("_f", "_lock")
+    ansi: ClassVar[bool] = False
     _f: TextIO
     _lock: threading.Lock
 
@@ -22,22 +51,246 @@ class FileHandler(IHandler):
         self._lock = threading.Lock()
 
     def __del__(self) -> None:
-        self._f.write(f"\n\nLog file closed at {now()}\n")
-        self._f.close()
+        self.close()
 
     def __repr__(self) -> str:
         return f"<FileHandler: {self._f.name}>"
 
     def log(self, msg: str) -> None:
+        self.emit(plain_text(msg))
+
+    def emit(self, msg: str) -> None:
         with self._lock:
-            self._f.write(filter_ansi(msg).replace("\r", "\n"))
-            self.flush()
+            self._f.write(msg)
+        self.flush()
 
     def flush(self) -> None:
         with self._lock:
+            if self._f.closed:
+                return
             self._f.flush()
             os.fsync(self._f.fileno())
 
+    def close(self) -> None:
+        with self._lock:
+            if self._f.closed:
+                return
+            self._f.write(f"\n\nLog file closed at {now()}\n")
+            self._f.close()
+
+
+class _QueueWriter:
+    """Bounded message buffer drained by a dedicated writer thread.
+
+    Kept separate from `QueuedFileHandler` so that the thread does not hold a reference
+    to the handler, which lets the handler be garbage collected and closed normally.
+    """
+
+    __slots__ = (
+        "_buf",
+        "_closed",
+        "_done",
+        "_f",
+        "_fsync_bytes",
+        "_fsync_interval",
+        "_has_data",
+        "_maxsize",
+        "_policy",
+        "_requested",
+        "_settled",
+        "_thread",
+        "dropped",
+    )
+    _f: TextIO
+    _buf: deque[str]
+    _maxsize: int
+    _policy: OverflowPolicy
+    _fsync_interval: float
+    _fsync_bytes: int
+    _has_data: threading.Condition
+    _settled: threading.Condition
+    _requested: int
+    _done: int
+    _closed: bool
+    _thread: threading.Thread
+    dropped: int
+
+    def __init__(
+        self,
+        f: TextIO,
+        *,
+        maxsize: int,
+        policy: OverflowPolicy,
+        fsync_interval: float,
+        fsync_bytes: int,
+    ) -> None:
+        lock = threading.Lock()
+        self._f = f
+        self._buf = deque()
+        self._maxsize = maxsize
+        self._policy = policy
+        self._fsync_interval = fsync_interval
+        self._fsync_bytes = fsync_bytes
+        self._has_data = threading.Condition(lock)
+        self._settled = threading.Condition(lock)
+        self._requested, self._done = 0, 0
+        self._closed = False
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f"QueuedFileHandler[{f.name}]", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, msg: str) -> None:
+        with self._has_data:
+            if self._closed:
+                return
+            if len(self._buf) >= self._maxsize:
+                match self._policy:
+                    case "drop-newest":
+                        self.dropped += 1
+                        return
+                    case "drop-oldest":
+                        self._buf.popleft()
+                        self.dropped += 1
+                    case "block":
+                        while len(self._buf) >= self._maxsize and not self._closed:
+                            self._settled.wait()
+                        if self._closed:
+                            return
+            self._buf.append(msg)
+            self._has_data.notify()
+
+    def flush(self) -> None:
+        with self._has_data:
+            if not self._thread.is_alive():
+                return
+            self._requested += 1
+            target = self._requested
+            self._has_data.notify()
+            while self._done < target and self._thread.is_alive():
+                self._settled.wait()
+
+    def close(self) -> None:
+        with self._has_data:
+            self._closed = True
+            self._requested += 1
+            self._has_data.notify()
+            self._settled.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        pending, last_sync = 0, time.monotonic()
+        while True:
+            with self._has_data:
+                while not (self._buf or self._closed or self._requested > self._done):
+                    timeout = None if pending == 0 else self._fsync_interval
+                    if not self._has_data.wait(timeout):
+                        break
+                batch = list(self._buf)
+                self._buf.clear()
+                requested, closed = self._requested, self._closed
+                self._settled.notify_all()
+            if batch:
+                text = "".join(batch)
+                self._f.write(text)
+                pending += len(text)
+            if pending and (
+                requested > self._done
+                or pending >= self._fsync_bytes
+                or time.monotonic() - last_sync >= self._fsync_interval
+            ):
+                self._f.flush()
+                os.fsync(self._f.fileno())
+                pending, last_sync = 0, time.monotonic()
+            with self._has_data:
+                self._done = requested
+                self._settled.notify_all()
+            if closed:
+                break
+        self._f.write(f"\n\nLog file closed at {now()}\n")
+        self._f.close()
+
+
+class QueuedFileHandler(IHandler):
+    """File handler that hands messages to a background writer thread.
+
+    `log` only enqueues the (ANSI-stripped) message; the writer thread coalesces everything
+    queued into a single write and calls `os.fsync` once `fsync_bytes` have been
+    written, `fsync_interval` seconds have elapsed, or on an explicit `flush`/`close`.
+
+    Parameters
+    ----------
+    file : Path | str
+        Log file, opened in append mode.
+    maxsize : int
+        Maximum number of queued messages.
+    overflow : OverflowPolicy
+        What `log` does when the queue is full: `"block"` waits for the writer,
+        `"drop-oldest"` discards the oldest queued message, `"drop-newest"` discards the
+        incoming message. Dropped messages are counted in `dropped`.
+    fsync_interval : float
+        Maximum number of seconds written data may stay unsynced.
+    fsync_bytes : int
+        Number of written characters that triggers a sync.
+
+    """
+
+    __slots__ = ("_finalizer", "_name", "_writer")
+    ansi: ClassVar[bool] = False
+    _name: str
+    _writer: _QueueWriter
+    _finalizer: weakref.finalize[[], QueuedFileHandler]
+
+    def __init__(
+        self,
+        file: Path | str,
+        *,
+        maxsize: int = 10000,
+        overflow: OverflowPolicy = "block",
+        fsync_interval: float = 1.0,
+        fsync_bytes: int = 1 << 20,
+    ) -> None:
+        if maxsize < 1:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        file = Path(file)
+        f = file.open("a", encoding="utf-8")
+        f.write(f"Log file created at {file}\n")
+        self._name = f.name
+        self._writer = _QueueWriter(
+            f,
+            maxsize=maxsize,
+            policy=overflow,
+            fsync_interval=fsync_interval,
+            fsync_bytes=fsync_bytes,
+        )
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<QueuedFileHandler: {self._name}>"
+
+    @property
+    def dropped(self) -> int:
+        """Number of messages discarded by the overflow policy."""
+        return self._writer.dropped
+
+    def log(self, msg: str) -> None:
+        self._writer.put(plain_text(msg))
+
+    def emit(self, msg: str) -> None:
+        self._writer.put(msg)
+
+    def flush(self) -> None:
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._finalizer()
+
 
 class STDOUTHandler(IHandler):
     def __init__(self) -> None: ...
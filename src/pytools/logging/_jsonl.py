@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Final, Literal, cast
+
+from ._handlers import plain_text
+from ._lazy import resolve
+from ._trait import IHandler, LogEnum, LogLevel
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping, Sequence
+
+    from ._string_parse import Caller
+
+__all__ = ["JSONLHandler", "iter_log_records", "make_record"]
+
+type RecordFormat = Literal["jsonl", "binary"]
+
+BINARY_MAGIC: Final = b"PTLOG\x01\n"
+_LENGTH: Final = struct.Struct("<I")
+_LEVEL_KEY: Final = b'"level":'
+
+
+def _default(obj: object) -> object:
+    if isinstance(obj, (set, frozenset)):
+        return list(cast("set[object]", obj))
+    if callable(tolist := getattr(obj, "tolist", None)):
+        return tolist()
+    return str(obj)
+
+
+_ENCODER: Final = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def make_record(
+    msg: Sequence[object], level: LogEnum | None, kwargs: Mapping[str, object], tb: Caller | None
+) -> dict[str, object]:
+    """Build the structured form of a log call, without colouring or `ppfmt`."""
+    rec: dict[str, object] = {
+        "ts": time.time(),
+        "level": None if level is None else level.name,
+    }
+    if tb is not None:
+        rec.update(file=tb.file, line=tb.lineno, function=tb.function)
+    rec["msg"] = "\n".join(m if isinstance(m, str) else str(m) for m in map(resolve, msg))
+    rec.update((k, resolve(v)) for k, v in kwargs.items())
+    return rec
+
+
+class JSONLHandler(IHandler):
+    """Machine-readable log sink writing one compact record per log call.
+
+    Records hold `ts` (epoch seconds), `level`, the caller's `file`, `line` and `function`,
+    `msg` and the raw keyword arguments passed to `StructLogger`. Plain text sent through
+    `log` (e.g. `disp`) is stored with a null level.
+
+    Parameters
+    ----------
+    file : Path | str
+        Output file, opened in append mode.
+    fmt : RecordFormat
+        `"jsonl"` writes one JSON object per line. `"binary"` writes each JSON payload
+        prefixed by its length as a little-endian uint32, after a short magic header, so
+        records may contain raw newlines and can be skipped without scanning.
+
+    """
+
+    __slots__ = ("_f", "_fmt", "_lock")
+    ansi: ClassVar[bool] = False
+    structured: ClassVar[bool] = True
+    _f: BinaryIO
+    _fmt: RecordFormat
+    _lock: threading.Lock
+
+    def __init__(self, file: Path | str, *, fmt: RecordFormat = "jsonl") -> None:
+        self._f = Path(file).open("ab")  # noqa: SIM115
+        self._fmt = fmt
+        self._lock = threading.Lock()
+        if fmt == "binary" and self._f.tell() == 0:
+            self._f.write(BINARY_MAGIC)
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<JSONLHandler: {self._f.name} ({self._fmt})>"
+
+    def log(self, msg: str) -> None:
+        self.emit(plain_text(msg))
+
+    def emit(self, msg: str) -> None:
+        self.record(make_record([msg.rstrip("\n")], None, {}, None))
+
+    def record(self, rec: Mapping[str, object]) -> None:
+        data = _ENCODER.encode(rec).encode("utf-8")
+        with self._lock:
+            if self._fmt == "binary":
+                self._f.write(_LENGTH.pack(len(data)) + data)
+            else:
+                self._f.write(data + b"\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._f.closed:
+                return
+            self._f.flush()
+            os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._f.close()
+
+
+def _iter_payloads(f: BinaryIO) -> Generator[bytes]:
+    if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        f.seek(0)
+        yield from f
+        return
+    while header := f.read(_LENGTH.size):
+        (size,) = _LENGTH.unpack(header)
+        yield f.read(size)
+
+
+def _record_level(payload: bytes) -> LogEnum | None:
+    start = payload.find(_LEVEL_KEY)
+    if start < 0:
+        return None
+    start += len(_LEVEL_KEY)
+    if payload[start : start + 1] != b'"':
+        return None
+    end = payload.find(b'"', start + 1)
+    return LogEnum[payload[start + 1 : end].decode()]
+
+
+def iter_log_records(
+    file: Path | str,
+    *,
+    level: LogLevel | LogEnum | None = None,
+    where: Mapping[str, object] | None = None,
+) -> Generator[dict[str, Any]]:
+    """Stream the records of a `JSONLHandler` file one at a time.
+
+    Parameters
+    ----------
+    file : Path | str
+        File written by `JSONLHandler`, in either format.
+    level : LogLevel | LogEnum | None
+        Only yield records at or above this level; plain text records are skipped.
+    where : Mapping[str, object] | None
+        Only yield records whose fields equal these values.
+
+    Returns
+    -------
+    Generator[dict[str, Any]]
+        Decoded records. Records below `level` are rejected before being decoded.
+
+    """
+    threshold = None if level is None else level if isinstance(level, LogEnum) else LogEnum[level]
+    needles = [_ENCODER.encode({k: v})[1:-1].encode("utf-8") for k, v in (where or {}).items()]
+    with Path(file).open("rb") as f:
+        for payload in _iter_payloads(f):
+            if not payload.strip():
+                continue
+            if threshold is not None:
+                lvl = _record_level(payload)
+                if lvl is None or lvl < threshold:
+                    continue
+            if not all(n in payload for n in needles):
+                continue
+            rec: dict[str, Any] = json.loads(payload)
+            if where and any(rec.get(k) != v for k, v in where.items()):
+                continue
+            yield rec
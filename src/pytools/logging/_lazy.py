@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from types import FunctionType
+from typing import TYPE_CHECKING
+
+from pytools.parsing import ppfmt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["Lazy", "render", "resolve"]
+
+
+class Lazy:
+    """Log message that is only built once a logger decides to emit it.
+
+    `Lazy(func, *args, **kwargs)` defers `func(*args, **kwargs)`, while a format string as
+    the first argument defers `fmt.format(*args, **kwargs)`. Zero-argument lambdas passed
+    directly to a logger are treated the same way.
+
+    Examples
+    --------
+    >>> logger.debug(Lazy("state = {}", large_array))
+    >>> logger.debug(lambda: expensive_summary(data))
+
+    """
+
+    __slots__ = ("args", "kwargs", "source")
+    source: str | Callable[..., object]
+    args: tuple[object, ...]
+    kwargs: dict[str, object]
+
+    def __init__(
+        self, source: str | Callable[..., object], /, *args: object, **kwargs: object
+    ) -> None:
+        self.source = source
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> object:
+        if isinstance(self.source, str):
+            return self.source.format(*self.args, **self.kwargs)
+        return self.source(*self.args, **self.kwargs)
+
+    def __str__(self) -> str:
+        return ppfmt(self())
+
+    def __repr__(self) -> str:
+        return f"<Lazy {self.source!r}>"
+
+
+def resolve(msg: object) -> object:
+    """Evaluate `msg` if it is a deferred message, otherwise return it unchanged."""
+    match msg:
+        case Lazy():
+            return msg()
+        case FunctionType(__name__="<lambda>"):
+            return msg()
+        case _:
+            return msg
+
+
+def render(msg: object) -> str:
+    return ppfmt(resolve(msg))
@@ -7,8 +7,10 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Final, Literal, override
 
 from ._basic_logger import BLogger
+from ._lazy import resolve
+from ._queue_logger import worker_logger
 from ._struct_logger import StructLogger
-from ._trait import IHandler, ILogger, LogEnum, LogLevel
+from ._trait import IHandler, ILogFilter, ILogger, LogEnum, LogLevel
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -28,27 +30,31 @@ def _create_logger(
     *,
     console: bool = True,
     logger: Literal["struct", "basic"] = "struct",
+    queued: bool = False,
 ) -> ILogger:
     match logger:
         case "struct":
-            return StructLogger(level=level, stdout=console, files=file)
+            return StructLogger(level=level, stdout=console, files=file, queued=queued)
         case "basic":
-            return BLogger(level=level, stdout=console, files=file)
+            return BLogger(level=level, stdout=console, files=file, queued=queued)
 
 
-def get_logger(
+def get_logger(  # noqa: PLR0913
     name: str | None = "__main__",
     *,
     level: LogLevel | LogEnum | None = None,
     console: bool = True,
     file: Sequence[str | Path] | None = None,
     logger: Literal["struct", "basic"] = "struct",
+    queued: bool = False,
 ) -> ILogger:
+    if name is None:
+        return NLOGGER
     if (
         multiprocessing.parent_process() is not None
         or threading.current_thread() is not threading.main_thread()
-    ) or (name is None):
-        return NLOGGER
+    ):
+        return worker_logger() or NLOGGER
     log = _LOGGERS_DICT.get(name)
     if log is None:
         level = LogEnum.INFO if level is None else level
@@ -56,14 +62,18 @@ def get_logger(
         _LOGGERS_DICT[name] = (
             NLOGGER
             if level is LogEnum.NULL
-            else _create_logger(level=level, console=console, file=file, logger=logger)
+            else _create_logger(
+                level=level, console=console, file=file, logger=logger, queued=queued
+            )
         )
         return _LOGGERS_DICT[name]
     if level is None or (log.level == level):
         return log
     if log.level is LogEnum.NULL:
         # Allow NullLogger to be replaced, but not BLoggers
-        _LOGGERS_DICT[name] = _create_logger(level=level, console=console, file=file, logger=logger)
+        _LOGGERS_DICT[name] = _create_logger(
+            level=level, console=console, file=file, logger=logger, queued=queued
+        )
         return _LOGGERS_DICT[name]
     msg = (
         f"Logger '{name}' already exists with level {log.level!s}. "
@@ -99,10 +109,21 @@ class _NullLogger(ILogger):
     def console(self, console: bool) -> None:
         sys.stderr.write("<<< Warning: Cannot set console on NullLogger\n")
 
+    def is_enabled_for(self, level: LogEnum) -> bool:
+        return level >= LogEnum.WARN
+
     def add_handler(self, handler: IHandler | Path | str, *, name: str | None = None) -> None: ...
 
     def remove_handler(self, handler: IHandler | str) -> None: ...
 
+    @property
+    def filters(self) -> Sequence[ILogFilter]:
+        return ()
+
+    def add_filter(self, filt: ILogFilter) -> None: ...
+
+    def remove_filter(self, filt: ILogFilter) -> None: ...
+
     def flush(self) -> None: ...
 
     @override
@@ -122,15 +143,15 @@ class _NullLogger(ILogger):
     def brief(self, *msg: object, **kwargs: object) -> None: ...
     @override
     def warn(self, *msg: object, **kwargs: object) -> None:
-        sys.stderr.write("<<< Warning: " + "\n".join(str(m) for m in msg) + "\n")
+        sys.stderr.write("<<< Warning: " + "\n".join(str(resolve(m)) for m in msg) + "\n")
 
     @override
     def error(self, *msg: object, **kwargs: object) -> None:
-        sys.stderr.write("<<< Error: " + "\n".join(str(m) for m in msg) + "\n")
+        sys.stderr.write("<<< Error: " + "\n".join(str(resolve(m)) for m in msg) + "\n")
 
     @override
     def fatal(self, *msg: object, **kwargs: object) -> None:
-        sys.stderr.write("<<< Fatal: " + "\n".join(str(m) for m in msg) + "\n")
+        sys.stderr.write("<<< Fatal: " + "\n".join(str(resolve(m)) for m in msg) + "\n")
 
     def exception(self, e: Exception) -> Exception:
         return e
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import math
+import multiprocessing
+import os
+import random
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Final, Self
+
+from ._logger import get_logger
+from ._queue_logger import worker_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ._trait import ILogger
+
+__all__ = [
+    "ProfileSnapshot",
+    "ScopeStats",
+    "profile_report",
+    "profile_report_at_exit",
+    "profile_stats",
+    "reset_profile",
+    "scope",
+    "ship_profile",
+]
+
+type ScopePath = tuple[str, ...]
+
+_RESERVOIR: Final = 256
+_UNITS: Final = ((1.0, "s"), (1e-3, "ms"))
+
+
+class ScopeStats:
+    """Accumulated durations of one scope, in seconds.
+
+    Percentiles are estimated from a fixed-size uniform sample of the durations.
+    """
+
+    __slots__ = ("_samples", "count", "max", "min", "total")
+    count: int
+    total: float
+    min: float
+    max: float
+    _samples: list[float]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._samples = []
+
+    def __repr__(self) -> str:
+        return f"<ScopeStats count={self.count} total={self.total:.6g}s>"
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, dt: float) -> None:
+        self.count += 1
+        self.total += dt
+        self.min = min(self.min, dt)
+        self.max = max(self.max, dt)
+        if len(self._samples) < _RESERVOIR:
+            self._samples.append(dt)
+        elif (i := random.randrange(self.count)) < _RESERVOIR:  # noqa: S311
+            self._samples[i] = dt
+
+    def merge(self, other: ScopeStats) -> None:
+        if other.count == 0:
+            return
+        # Keep the sample proportional to the number of calls each side represents.
+        weight = other.count / (self.count + other.count)
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        pool = self._samples + other._samples
+        if len(pool) <= _RESERVOIR:
+            self._samples = pool
+            return
+        n_other = min(len(other._samples), round(_RESERVOIR * weight))
+        n_self = min(len(self._samples), _RESERVOIR - n_other)
+        self._samples = random.sample(self._samples, n_self) + random.sample(
+            other._samples, n_other
+        )
+
+    def copy(self) -> ScopeStats:
+        new = ScopeStats()
+        new.merge(self)
+        return new
+
+    def percentile(self, q: float) -> float:
+        """Estimate the `q`-th percentile, for `q` in [0, 100]."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+class _Registry(threading.local):
+    stack: list[tuple[ScopePath, float]]
+    stats: dict[ScopePath, ScopeStats]
+
+    def __init__(self) -> None:
+        self.stack = []
+        self.stats = {}
+        with _LOCK:
+            _THREAD_STATS.append(self.stats)
+
+
+_LOCK: Final = threading.Lock()
+_THREAD_STATS: Final[list[dict[ScopePath, ScopeStats]]] = []
+_MERGED: Final[dict[ScopePath, ScopeStats]] = {}
+_LOCAL: Final = _Registry()
+
+
+def _reset_in_child() -> None:
+    # A forked worker starts with a copy of the parent's stats, which it must not send
+    # back, and with the scopes that were open in the forking thread.
+    _clear()
+    _LOCAL.stack.clear()
+
+
+os.register_at_fork(after_in_child=_reset_in_child)
+
+
+class scope(contextlib.ContextDecorator):  # noqa: N801
+    """Time a block or function as a named scope of the profiler.
+
+    Scopes entered while another is active in the same thread are recorded as its
+    children. Timings are kept in memory per thread and only combined by `profile_stats`
+    and `profile_report`, so an active scope costs two clock reads and a dict lookup.
+
+    Examples
+    --------
+    >>> @scope("solve")
+    ... def solve(): ...
+    >>> with scope("assemble"):
+    ...     ...
+
+    """
+
+    __slots__ = ("name",)
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<scope {self.name!r}>"
+
+    def __enter__(self) -> Self:
+        stack = _LOCAL.stack
+        path = (*stack[-1][0], self.name) if stack else (self.name,)
+        stack.append((path, perf_counter()))
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        end = perf_counter()
+        path, start = _LOCAL.stack.pop()
+        stats = _LOCAL.stats.get(path)
+        if stats is None:
+            stats = _LOCAL.stats[path] = ScopeStats()
+        stats.add(end - start)
+
+
+class ProfileSnapshot:
+    """Picklable copy of profiler stats, used to send a worker's stats to its parent."""
+
+    __slots__ = ("stats",)
+    stats: dict[ScopePath, ScopeStats]
+
+    def __init__(self, stats: Mapping[ScopePath, ScopeStats]) -> None:
+        self.stats = dict(stats)
+
+    def __repr__(self) -> str:
+        return f"<ProfileSnapshot scopes={len(self.stats)}>"
+
+    def apply(self) -> None:
+        """Merge into the stats of this process."""
+        with _LOCK:
+            _merge_into(_MERGED, self.stats)
+
+
+def _merge_into(
+    target: dict[ScopePath, ScopeStats], source: Mapping[ScopePath, ScopeStats]
+) -> None:
+    for path, stats in source.items():
+        if (current := target.get(path)) is None:
+            target[path] = stats.copy()
+        else:
+            current.merge(stats)
+
+
+def _combined() -> dict[ScopePath, ScopeStats]:
+    combined: dict[ScopePath, ScopeStats] = {}
+    _merge_into(combined, _MERGED)
+    for stats in _THREAD_STATS:
+        _merge_into(combined, dict(stats))
+    return combined
+
+
+def _clear() -> None:
+    _MERGED.clear()
+    for stats in _THREAD_STATS:
+        stats.clear()
+
+
+def profile_stats() -> dict[ScopePath, ScopeStats]:
+    """Return the stats of every scope, combined over threads and shipped worker stats."""
+    with _LOCK:
+        return _combined()
+
+
+def reset_profile() -> None:
+    with _LOCK:
+        _clear()
+
+
+def ship_profile() -> None:
+    """Send this worker's stats to the `LogListener` of its parent and reset them.
+
+    Called by `pytools.parallel` after each task run in a worker process. Does nothing
+    in the main process, whose worker threads record into the shared registry directly.
+    """
+    if multiprocessing.parent_process() is None or (log := worker_logger()) is None:
+        return
+    with _LOCK:
+        stats = _combined()
+        _clear()
+    if stats:
+        log.send(ProfileSnapshot(stats))
+
+
+def _fmt_time(t: float) -> str:
+    for scale, unit in _UNITS:
+        if t >= scale:
+            return f"{t / scale:.3f} {unit}"
+    return f"{t * 1e6:.3f} us"
+
+
+def profile_report(logger: ILogger | None = None, *, reset: bool = False) -> None:
+    """Log the profiler stats as a tree of scopes, sorted by total time.
+
+    Parameters
+    ----------
+    logger : ILogger | None
+        Logger to write to, by default `get_logger()`.
+    reset : bool
+        Clear the stats once reported.
+
+    """
+    logger = get_logger() if logger is None else logger
+    stats = profile_stats()
+    if reset:
+        reset_profile()
+    if not stats:
+        logger.disp("<<< Profile: no scopes recorded")
+        return
+    children: dict[ScopePath, list[ScopePath]] = {}
+    for path in stats:
+        children.setdefault(path[:-1], []).append(path)
+    width = max(2 * (len(p) - 1) + len(p[-1]) for p in stats)
+    cols = ("count", "total", "mean", "min", "p50", "p95", "max")
+    lines = [f"{'scope':<{width}}  {cols[0]:>8}" + "".join(f"  {c:>10}" for c in cols[1:])]
+
+    def walk(parent: ScopePath) -> None:
+        for path in sorted(children.get(parent, []), key=lambda p: -stats[p].total):
+            s = stats[path]
+            name = "  " * (len(path) - 1) + path[-1]
+            times = (s.total, s.mean, s.min, s.percentile(50), s.percentile(95), s.max)
+            lines.append(
+                f"{name:<{width}}  {s.count:>8}" + "".join(f"  {_fmt_time(t):>10}" for t in times)
+            )
+            walk(path)
+
+    walk(())
+    logger.disp("<<< Profile:", "\n".join(lines))
+
+
+def profile_report_at_exit(logger: ILogger | None = None) -> None:
+    """Log `profile_report` when the interpreter exits."""
+    atexit.register(profile_report, logger)
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import weakref
+from multiprocessing import util
+from typing import TYPE_CHECKING, Final, Literal, NamedTuple, Protocol, Self, override
+
+from ._filters import drain_filters, run_filters, unfiltered
+from ._lazy import render
+from ._string_parse import caller
+from ._struct_logger import format_record
+from ._trait import IHandler, ILogFilter, ILogger, LogEnum, LogLevel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+__all__ = ["LogListener", "QueueLogger", "flush_workers", "install_worker", "worker_logger"]
+
+
+class Payload(Protocol):
+    """Non-text item sent by a worker; the listener calls `apply` in the parent."""
+
+    def apply(self) -> None: ...
+
+
+type LogBatch = list[str | Payload]
+type LogQueue = multiprocessing.Queue[LogBatch | None] | queue.SimpleQueue[LogBatch | None]
+
+
+class _Sink(NamedTuple):
+    queue: LogQueue
+    level: LogEnum
+    header: bool
+    pid: int
+    filters: tuple[ILogFilter, ...]
+
+
+_SINKS: Final[list[_Sink]] = []
+_LOCAL: Final = threading.local()
+_WORKERS: Final[weakref.WeakSet[QueueLogger]] = weakref.WeakSet()
+
+
+class QueueLogger(ILogger):
+    """Proxy logger handed out by `get_logger` in worker threads and processes.
+
+    Records are rendered to text in the worker and sent in batches to the `LogListener`
+    in the parent process, which passes them on to its logger. Only lists of strings
+    cross the queue, so arbitrary log arguments are never pickled. Filters are applied in
+    the worker, before anything is formatted or sent.
+    """
+
+    __slots__ = (
+        "_batch",
+        "_buffer",
+        "_filters",
+        "_header",
+        "_interval",
+        "_level",
+        "_lock",
+        "_queue",
+        "_since",
+    )
+    _queue: LogQueue
+    _level: LogEnum
+    _header: bool
+    _batch: int
+    _interval: float
+    _buffer: LogBatch
+    _since: float
+    _lock: threading.Lock
+    _filters: list[ILogFilter]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        q: LogQueue,
+        level: LogEnum,
+        *,
+        header: bool = True,
+        filters: Sequence[ILogFilter] = (),
+        batch: int = 64,
+        interval: float = 0.2,
+    ) -> None:
+        self._queue = q
+        self._level = level
+        self._header = header
+        self._filters = list(filters)
+        self._batch = batch
+        self._interval = interval
+        self._buffer = []
+        self._since = 0.0
+        self._lock = threading.Lock()
+
+    def __del__(self) -> None:
+        with contextlib.suppress(ValueError, OSError):
+            self.flush()
+
+    def __repr__(self) -> str:
+        return f"<QueueLogger level={self._level.name} pid={os.getpid()}>"
+
+    @property
+    def header(self) -> bool:
+        return self._header
+
+    @property
+    def level(self) -> LogEnum:
+        return self._level
+
+    @level.setter
+    def level(self, level: LogLevel | LogEnum) -> None:
+        self._level = level if isinstance(level, LogEnum) else LogEnum[level]
+
+    @property
+    def console(self) -> bool:
+        return False
+
+    @console.setter
+    @override
+    def console(self, console: bool) -> None:
+        sys.stderr.write("<<< Warning: Cannot set console on QueueLogger\n")
+
+    def is_enabled_for(self, level: LogEnum) -> bool:
+        return self._level <= level
+
+    @override
+    def add_handler(self, handler: IHandler | Path | str, *, name: str | None = None) -> None:
+        sys.stderr.write("<<< Warning: Cannot add handlers to QueueLogger\n")
+
+    @override
+    def remove_handler(self, handler: IHandler | str) -> None: ...
+
+    @property
+    def filters(self) -> Sequence[ILogFilter]:
+        return tuple(self._filters)
+
+    def add_filter(self, filt: ILogFilter) -> None:
+        self._filters.append(filt)
+
+    def remove_filter(self, filt: ILogFilter) -> None:
+        if filt in self._filters:
+            self._filters.remove(filt)
+
+    def flush(self) -> None:
+        if self._filters:
+            for note in drain_filters(self._filters):
+                self._put(note)
+        with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+        self._queue.put(batch)
+
+    def send(self, payload: Payload) -> None:
+        """Queue `payload` to be applied by the listener, together with pending records."""
+        with self._lock:
+            self._buffer.append(payload)
+            batch, self._buffer = self._buffer, []
+        self._queue.put(batch)
+
+    def _put(self, text: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not self._buffer:
+                self._since = now
+            self._buffer.append(text)
+            if len(self._buffer) < self._batch and now - self._since < self._interval:
+                return
+            batch, self._buffer = self._buffer, []
+        self._queue.put(batch)
+
+    @override
+    def log(self, *msg: object, level: LogEnum = LogEnum.BRIEF, **kwargs: object) -> None:
+        if len(msg) < 1:
+            return
+        if self._filters:
+            if (notes := run_filters(self._filters, msg, 2)) is None:
+                return
+            for note in notes:
+                self._put(note)
+        tb = caller(2) if level > LogEnum.BRIEF or kwargs else None
+        self._put(format_record(msg, level, kwargs, header=self._header, tb=tb))
+
+    @override
+    def disp(
+        self, *msg: object, end: Literal["\n", "\r", ""] = "\n", filt: LogEnum | None = None
+    ) -> None:
+        if filt and self._level <= filt:
+            return
+        if self._filters:
+            if (notes := run_filters(self._filters, msg, 1)) is None:
+                return
+            for note in notes:
+                self._put(note)
+        self._put("\n".join([render(m) for m in msg]) + end)
+
+    @override
+    def debug(self, *msg: object, **kwargs: object) -> None:
+        if self._level <= LogEnum.DEBUG:
+            self.log(*msg, level=LogEnum.DEBUG, **kwargs)
+
+    @override
+    def info(self, *msg: object, **kwargs: object) -> None:
+        if self._level <= LogEnum.INFO:
+            self.log(*msg, level=LogEnum.INFO, **kwargs)
+
+    @override
+    def brief(self, *msg: object, **kwargs: object) -> None:
+        if self._level <= LogEnum.BRIEF:
+            self.log(*msg, level=LogEnum.BRIEF, **kwargs)
+
+    @override
+    def warn(self, *msg: object, **kwargs: object) -> None:
+        if self._level <= LogEnum.WARN:
+            self.log(*msg, level=LogEnum.WARN, **kwargs)
+
+    @override
+    def error(self, *msg: object, **kwargs: object) -> None:
+        if self._level <= LogEnum.ERROR:
+            self.log(*msg, level=LogEnum.ERROR, **kwargs)
+
+    @override
+    def fatal(self, *msg: object, **kwargs: object) -> None:
+        if self._level <= LogEnum.FATAL:
+            self.log(*msg, level=LogEnum.FATAL, **kwargs)
+
+    def exception(self, e: Exception) -> Exception:
+        self.disp(traceback.format_exc())
+        return e
+
+
+def install_worker(
+    q: LogQueue | None,
+    level: LogEnum,
+    header: bool,  # noqa: FBT001
+    filters: tuple[ILogFilter, ...] = (),
+) -> None:
+    """Route `get_logger` calls in this process to `q`.
+
+    Used as the pool initializer returned by `LogListener.initializer`.
+    """
+    if q is None:
+        return
+    _SINKS.append(_Sink(q, level, header, os.getpid(), filters))
+    util.Finalize(None, flush_workers, exitpriority=100)
+
+
+def worker_logger() -> QueueLogger | None:
+    """Return this thread's `QueueLogger`, or None if no listener is reachable."""
+    if not _SINKS or (sink := _SINKS[-1]).pid != os.getpid():
+        return None
+    log: QueueLogger | None = getattr(_LOCAL, "logger", None)
+    if log is None or getattr(_LOCAL, "sink", None) is not sink:
+        log = QueueLogger(sink.queue, sink.level, header=sink.header, filters=sink.filters)
+        _LOCAL.logger, _LOCAL.sink = log, sink
+        _WORKERS.add(log)
+    return log
+
+
+def flush_workers() -> None:
+    """Send the buffered records of every worker logger in this process."""
+    for log in list(_WORKERS):
+        log.flush()
+
+
+class LogListener:
+    """Receive records from worker threads and processes and pass them to `logger`.
+
+    While started, `get_logger` returns a `QueueLogger` in non-main threads of this
+    process. Process pools must be created with `initializer` and `initargs` so that
+    their workers do the same. Workers get the filters of `logger` as they are when the
+    listener is started; records received from them are not filtered again.
+
+    Parameters
+    ----------
+    logger : ILogger
+        Logger in this process that receives the records.
+    processes : bool
+        Use a `multiprocessing.Queue` that can be shared with process pools; otherwise
+        a cheaper in-process queue for thread pools.
+
+    Examples
+    --------
+    >>> listener = LogListener(get_logger(), processes=True)
+    >>> with listener, ProcessPoolExecutor(
+    ...     4, initializer=listener.initializer, initargs=listener.initargs
+    ... ) as exe:
+    ...     exe.submit(work)
+
+    """
+
+    __slots__ = ("_logger", "_queue", "_sink", "_thread")
+    _logger: ILogger
+    _queue: LogQueue | None
+    _sink: _Sink | None
+    _thread: threading.Thread | None
+
+    def __init__(self, logger: ILogger, *, processes: bool = True) -> None:
+        self._logger = logger
+        self._queue = None
+        if logger.level is not LogEnum.NULL:
+            self._queue = multiprocessing.Queue() if processes else queue.SimpleQueue()
+        self._sink = None
+        self._thread = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *_args: object) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<LogListener logger={self._logger!r}>"
+
+    @property
+    def initializer(
+        self,
+    ) -> Callable[[LogQueue | None, LogEnum, bool, tuple[ILogFilter, ...]], None]:
+        """Pool initializer that routes worker `get_logger` calls to this listener."""
+        return install_worker
+
+    @property
+    def initargs(self) -> tuple[LogQueue | None, LogEnum, bool, tuple[ILogFilter, ...]]:
+        return (self._queue, self._logger.level, self._logger.header, tuple(self._logger.filters))
+
+    def start(self) -> Self:
+        if self._queue is None or self._thread is not None:
+            return self
+        self._sink = _Sink(
+            self._queue,
+            self._logger.level,
+            self._logger.header,
+            os.getpid(),
+            tuple(self._logger.filters),
+        )
+        _SINKS.append(self._sink)
+        self._thread = threading.Thread(target=self._run, name="LogListener", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._queue is None or self._thread is None:
+            return
+        flush_workers()
+        if self._sink is not None and self._sink in _SINKS:
+            _SINKS.remove(self._sink)
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._logger.flush()
+
+    def _run(self) -> None:
+        if self._queue is None:
+            return
+        with unfiltered():
+            while (batch := self._queue.get()) is not None:
+                for item in batch:
+                    if isinstance(item, str):
+                        self._logger.disp(item, end="")
+                    else:
+                        item.apply()
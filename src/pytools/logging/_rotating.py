@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import contextlib
+import gzip
+import lzma
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import ClassVar, Literal, TextIO, get_args
+
+from ._handlers import plain_text
+from ._string_parse import now
+from ._trait import IHandler
+
+__all__ = ["RotatingFileHandler"]
+
+# Same modes as `pytools.path` archives (`archive tar --type`).
+type Compression = Literal["gz", "xz"]
+
+
+def _open_compressed(file: Path, mode: Compression) -> gzip.GzipFile | lzma.LZMAFile:
+    match mode:
+        case "gz":
+            return gzip.GzipFile(file, "wb")
+        case "xz":
+            return lzma.LZMAFile(file, "wb")
+
+
+class _Retention:
+    """Compresses finished segments and enforces retention on a background thread."""
+
+    __slots__ = ("_budget", "_count", "_jobs", "_mode", "_pattern", "_thread")
+    _mode: Compression | None
+    _count: int | None
+    _budget: int | None
+    _pattern: re.Pattern[str]
+    _jobs: queue.SimpleQueue[Path | None]
+    _thread: threading.Thread
+
+    def __init__(
+        self,
+        file: Path,
+        mode: Compression | None,
+        backup_count: int | None,
+        max_total_bytes: int | None,
+    ) -> None:
+        self._mode = mode
+        self._count = backup_count
+        self._budget = max_total_bytes
+        self._pattern = re.compile(
+            rf"{re.escape(file.stem)}\.(\d{{8}}-\d{{6}})(?:-(\d+))?{re.escape(file.suffix)}(\.gz|\.xz)?"
+        )
+        self._jobs = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name=f"RotatingFileHandler[{file.name}]", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, segment: Path) -> None:
+        self._jobs.put(segment)
+
+    def close(self) -> None:
+        self._jobs.put(None)
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while (segment := self._jobs.get()) is not None:
+            # The segment may already have been pruned by the budget of a later rollover.
+            if self._mode is not None and segment.exists():
+                with contextlib.suppress(FileNotFoundError):
+                    self._compress(segment, self._mode)
+            self._prune(segment.parent)
+
+    @staticmethod
+    def _compress(segment: Path, mode: Compression) -> None:
+        target = segment.with_name(f"{segment.name}.{mode}")
+        partial = target.with_name(f"{target.name}.part")
+        with segment.open("rb") as src, _open_compressed(partial, mode) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        partial.replace(target)
+        segment.unlink()
+
+    def _prune(self, folder: Path) -> None:
+        if self._count is None and self._budget is None:
+            return
+        segments = [
+            (m[1], int(m[2] or 0), entry)
+            for entry in os.scandir(folder)
+            if (m := self._pattern.fullmatch(entry.name))
+        ]
+        segments.sort(key=lambda seg: seg[:2], reverse=True)
+        total = 0
+        for i, (_, _, entry) in enumerate(segments):
+            path = Path(entry.path)
+            total += entry.stat().st_size
+            if (self._count is not None and i >= self._count) or (
+                self._budget is not None and total > self._budget
+            ):
+                path.unlink(missing_ok=True)
+
+
+class RotatingFileHandler(IHandler):
+    """File handler that starts a new file by size or age and archives the old ones.
+
+    The active file keeps its name. On rollover it is renamed to
+    `<stem>.<YYYYmmdd-HHMMSS><suffix>` and handed to a background thread, which compresses
+    it and deletes the oldest segments beyond the retention limits, so the logging caller
+    never waits for compression.
+
+    Parameters
+    ----------
+    file : Path | str
+        Active log file.
+    max_bytes : int | None
+        Roll over once this many characters have been written to the active file.
+    interval : float | None
+        Roll over once the active file is this many seconds old.
+    backup_count : int | None
+        Number of finished segments to keep.
+    max_total_bytes : int | None
+        Disk budget for finished segments, after compression.
+    compress : Compression | None
+        Compression applied to finished segments, `None` to keep them as is.
+
+    """
+
+    __slots__ = (
+        "_deadline",
+        "_f",
+        "_file",
+        "_finalizer",
+        "_interval",
+        "_lock",
+        "_max",
+        "_n",
+        "_retention",
+    )
+    ansi: ClassVar[bool] = False
+    _file: Path
+    _f: TextIO
+    _lock: threading.Lock
+    _max: int | None
+    _interval: float | None
+    _n: int
+    _deadline: float
+    _retention: _Retention
+    _finalizer: weakref.finalize[[], RotatingFileHandler]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        file: Path | str,
+        *,
+        max_bytes: int | None = None,
+        interval: float | None = None,
+        backup_count: int | None = None,
+        max_total_bytes: int | None = None,
+        compress: Compression | None = "gz",
+    ) -> None:
+        self._file = Path(file)
+        self._max = max_bytes
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._retention = _Retention(self._file, compress, backup_count, max_total_bytes)
+        self._finalizer = weakref.finalize(self, self._retention.close)
+        self._open()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<RotatingFileHandler: {self._file}>"
+
+    def _open(self) -> None:
+        self._f = self._file.open("a", encoding="utf-8")
+        self._f.write(f"Log file created at {self._file}\n")
+        self._n = self._f.tell()
+        self._deadline = time.monotonic() + self._interval if self._interval else float("inf")
+
+    def _rollover(self) -> None:
+        self._f.write(f"\n\nLog file closed at {now()}\n")
+        self._f.close()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime())
+        segment = self._file.with_name(f"{self._file.stem}.{stamp}{self._file.suffix}")
+        k = 0
+        while segment.exists() or any(
+            segment.with_name(f"{segment.name}.{mode}").exists()
+            for mode in get_args(Compression.__value__)
+        ):
+            k += 1
+            segment = self._file.with_name(f"{self._file.stem}.{stamp}-{k}{self._file.suffix}")
+        self._file.replace(segment)
+        self._retention.submit(segment)
+        self._open()
+
+    def log(self, msg: str) -> None:
+        self.emit(plain_text(msg))
+
+    def emit(self, msg: str) -> None:
+        with self._lock:
+            if self._f.closed:
+                return
+            self._f.write(msg)
+            self._n += len(msg)
+            if (self._max is not None and self._n >= self._max) or (
+                time.monotonic() >= self._deadline
+            ):
+                self._rollover()
+
+    def rollover(self) -> None:
+        """Start a new segment now."""
+        with self._lock:
+            if not self._f.closed:
+                self._rollover()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._f.closed:
+                return
+            self._f.flush()
+            os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._f.closed:
+                self._f.write(f"\n\nLog file closed at {now()}\n")
+                self._f.close()
+        self._finalizer()
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+import inspect
 import re
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Final, NamedTuple
 
 from pytools.result import Err, Ok
 
 from ._trait import BColors, LogEnum
 
 if TYPE_CHECKING:
-    from inspect import Traceback
+    from types import CodeType
 
-__all__ = ["cstr", "debug_str", "filter_ansi", "now"]
+__all__ = ["Caller", "Site", "call_site", "caller", "cstr", "debug_str", "filter_ansi", "now"]
 
 LB: Final = {
     LogEnum.NULL: BColors.NULL,
@@ -43,15 +44,55 @@ def cstr(level: LogEnum) -> str:
     return f"{LB[level]}{level}{RB[level]}"
 
 
-def debug_str(tb: Traceback) -> str:
-    file = Path(*Path(tb.filename).parts[-3:])
-    return f"({file}:{tb.lineno}|{tb.function})"
+class Caller(NamedTuple):
+    file: str
+    lineno: int
+    function: str
 
 
-def debug_info(tb: Traceback) -> dict[str, str]:
-    file = Path(*Path(tb.filename).parts[-3:])
+_CODE_FILES: Final[dict[CodeType, str]] = {}
+
+
+def caller(depth: int = 1) -> Caller:
+    """Return the location `depth` frames above the function calling this.
+
+    Walks the frame chain directly instead of going through `inspect.stack`, so no source
+    lines are read and no other frames are materialised. The trimmed file path is cached
+    per code object.
+    """
+    frame = inspect.currentframe()
+    for _ in range(depth + 1):
+        frame = frame.f_back if frame else None
+    if frame is None:
+        return Caller("<unknown>", 0, "<unknown>")
+    code = frame.f_code
+    file = _CODE_FILES.get(code)
+    if file is None:
+        file = _CODE_FILES[code] = str(Path(*Path(code.co_filename).parts[-3:]))
+    return Caller(file, frame.f_lineno, code.co_name)
+
+
+type Site = tuple[str, int]
+"""Call site key, as the raw file name and line number of the logging call."""
+
+
+def call_site(depth: int = 1) -> Site:
+    """Like `caller`, but only return the file and line, without any path processing."""
+    frame = inspect.currentframe()
+    for _ in range(depth + 1):
+        frame = frame.f_back if frame else None
+    if frame is None:
+        return ("<unknown>", 0)
+    return (frame.f_code.co_filename, frame.f_lineno)
+
+
+def debug_str(tb: Caller) -> str:
+    return f"({tb.file}:{tb.lineno}|{tb.function})"
+
+
+def debug_info(tb: Caller) -> dict[str, str]:
     return {
-        "file": str(file),
+        "file": tb.file,
         "function": tb.function,
         "line": str(tb.lineno),
     }
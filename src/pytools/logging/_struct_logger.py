@@ -1,25 +1,46 @@
 from __future__ import annotations
 
 import traceback
-from inspect import getframeinfo, stack
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 from pytools.parsing import ppfmt
 
-from ._handlers import STDOUT_HANDLER, FileHandler
-from ._string_parse import cstr, debug_info, now
-from ._trait import BColors, IHandler, ILogger, LogEnum, LogLevel
+from ._filters import drain_filters, run_filters
+from ._handlers import STDOUT_HANDLER, FileHandler, QueuedFileHandler, dispatch
+from ._jsonl import make_record
+from ._lazy import render, resolve
+from ._string_parse import caller, cstr, debug_info, now
+from ._trait import BColors, IHandler, ILogFilter, ILogger, LogEnum, LogLevel
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from ._string_parse import Caller
+
+
+def format_record(
+    msg: Sequence[object],
+    level: LogEnum,
+    kwargs: Mapping[str, object],
+    *,
+    header: bool,
+    tb: Caller | None,
+) -> str:
+    message = "\n".join([render(m) for m in msg])
+    head = f"[{now()}|{cstr(level)}]>>> " if header else ""
+    if tb is not None:
+        data = {**debug_info(tb), "msg": message} | {k: resolve(v) for k, v in kwargs.items()}
+        message = message + "\n" + ppfmt(data)
+    return head + message + "\n"
 
 
 class StructLogger(ILogger):
-    __slots__ = ["_handlers", "_header", "_level"]
+    __slots__ = ["_filters", "_handlers", "_header", "_level"]
     _level: LogEnum
     _handlers: dict[str, IHandler]
     _header: bool
+    _filters: list[ILogFilter]
 
     def __init__(
         self,
@@ -28,12 +49,15 @@ class StructLogger(ILogger):
         header: bool = True,
         stdout: bool = True,
         files: Sequence[str | Path] | None = None,
+        queued: bool = False,
     ) -> None:
         self._level = level if isinstance(level, LogEnum) else LogEnum[level]
         self._header = header
+        self._filters = []
         self._handlers = {"STDOUT": STDOUT_HANDLER} if stdout else {}
         if files is not None:
-            self._handlers.update({str(f): FileHandler(f) for f in files})
+            handler = QueuedFileHandler if queued else FileHandler
+            self._handlers.update({str(f): handler(f) for f in files})
         for h in self._handlers.values():
             if self._level < LogEnum.BRIEF:
                 continue
@@ -78,6 +102,9 @@ class StructLogger(ILogger):
             return
         del self._handlers["STDOUT"]
 
+    def is_enabled_for(self, level: LogEnum) -> bool:
+        return self._level <= level and bool(self._handlers)
+
     def add_handler(self, handler: IHandler | Path | str, *, name: str | None = None) -> None:
         if isinstance(handler, (str, Path)):
             handler = FileHandler(handler)
@@ -89,53 +116,82 @@ class StructLogger(ILogger):
         if key in self._handlers:
             del self._handlers[key]
 
+    @property
+    def filters(self) -> Sequence[ILogFilter]:
+        return tuple(self._filters)
+
+    def add_filter(self, filt: ILogFilter) -> None:
+        self._filters.append(filt)
+
+    def remove_filter(self, filt: ILogFilter) -> None:
+        if filt in self._filters:
+            self._filters.remove(filt)
+
     def flush(self) -> None:
+        if self._filters and self._handlers:
+            for note in drain_filters(self._filters):
+                dispatch(self._handlers.values(), note)
         for h in self._handlers.values():
             h.flush()
 
     def disp(
         self, *msg: object, end: Literal["\n", "\r", ""] = "\n", filt: LogEnum | None = None
     ) -> None:
-        if filt and self._level <= filt:
+        if (filt and self._level <= filt) or not self._handlers:
             return
-        message = "\n".join([ppfmt(m) for m in msg])
-        for h in self._handlers.values():
-            h.log(message + end)
+        if self._filters:
+            if (notes := run_filters(self._filters, msg, 1)) is None:
+                return
+            for note in notes:
+                dispatch(self._handlers.values(), note)
+        message = "\n".join([render(m) for m in msg])
+        dispatch(self._handlers.values(), message + end)
 
     def log(self, *msg: object, level: LogEnum = LogEnum.BRIEF, **kwargs: object) -> None:
-        if len(msg) < 1:
+        if len(msg) < 1 or not self._handlers:
             return
-        message = "\n".join([ppfmt(m) for m in msg])
-        header = f"[{now()}|{cstr(level)}]>>> " if self._header else ""
-        if level > LogEnum.BRIEF or kwargs:
-            tb = getframeinfo(stack()[2][0])
-            kwargs = {**debug_info(tb), "msg": message, **kwargs}
-            message = message + "\n" + ppfmt(kwargs)
-        for h in self._handlers.values():
-            h.log(header + message + "\n")
+        if self._filters:
+            if (notes := run_filters(self._filters, msg, 2)) is None:
+                return
+            for note in notes:
+                dispatch(self._handlers.values(), note)
+        handlers: Iterable[IHandler] = self._handlers.values()
+        if any(h.structured for h in handlers):
+            tb = caller(2)
+            rec = make_record(msg, level, kwargs, tb)
+            for h in handlers:
+                if h.structured:
+                    h.record(rec)
+            handlers = [h for h in handlers if not h.structured]
+            if not handlers:
+                return
+            tb = tb if level > LogEnum.BRIEF or kwargs else None
+        else:
+            tb = caller(2) if level > LogEnum.BRIEF or kwargs else None
+        dispatch(handlers, format_record(msg, level, kwargs, header=self._header, tb=tb))
 
     def debug(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.DEBUG:
+        if self.is_enabled_for(LogEnum.DEBUG):
             self.log(*msg, level=LogEnum.DEBUG, **kwargs)
 
     def info(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.INFO:
+        if self.is_enabled_for(LogEnum.INFO):
             self.log(*msg, level=LogEnum.INFO, **kwargs)
 
     def brief(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.BRIEF:
+        if self.is_enabled_for(LogEnum.BRIEF):
             self.log(*msg, level=LogEnum.BRIEF, **kwargs)
 
     def warn(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.WARN:
+        if self.is_enabled_for(LogEnum.WARN):
             self.log(*msg, level=LogEnum.WARN, **kwargs)
 
     def error(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.ERROR:
+        if self.is_enabled_for(LogEnum.ERROR):
             self.log(*msg, level=LogEnum.ERROR, **kwargs)
 
     def fatal(self, *msg: object, **kwargs: object) -> None:
-        if self._level <= LogEnum.FATAL:
+        if self.is_enabled_for(LogEnum.FATAL):
             self.log(*msg, level=LogEnum.FATAL, **kwargs)
 
     def exception(self, e: Exception) -> Exception:
@@ -143,4 +199,6 @@ class StructLogger(ILogger):
         return e
 
     def close(self) -> None:
+        for h in self._handlers.values():
+            h.close()
         self._handlers.clear()
@@ -1,7 +1,12 @@
+import reprlib
 from functools import wraps
 from time import perf_counter
 from typing import TYPE_CHECKING, ParamSpec, TypeVar
 
+from ._lazy import Lazy
+from ._logger import get_logger
+from ._profile import scope
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -9,15 +14,27 @@ if TYPE_CHECKING:
 P = ParamSpec("P")
 R = TypeVar("R")
 
+_REPR = reprlib.Repr(maxlevel=2, maxstring=40, maxother=40)
+
+
+def _describe(name: str, args: tuple[object, ...], kw: dict[str, object], dt: float) -> str:
+    return f"func {name!r} args:[{_REPR.repr(args)}, {_REPR.repr(kw)}] took: {dt:.4f} sec"
+
 
 def timeit[**P, R](f: Callable[P, R]) -> Callable[P, R]:
+    """Record every call of `f` as a profiler scope and log its duration at DEBUG.
+
+    Arguments are only summarised with `reprlib` when the message is actually emitted.
+    """
+    timer = scope(f.__qualname__)
+
     @wraps(f)
     def wrap(*args: P.args, **kw: P.kwargs) -> R:
         ts = perf_counter()
-        result = f(*args, **kw)
+        with timer:
+            result = f(*args, **kw)
         te = perf_counter()
-        msg = f"func{f.__name__!r} args:[{args!r}, {kw!r}] took: {te - ts:.4f} sec"
-        print(msg)
+        get_logger().debug(Lazy(_describe, f.__name__, args, kw, te - ts))
         return result
 
     return wrap
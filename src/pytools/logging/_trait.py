@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import abc
 import enum
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
     from pathlib import Path
 
-__all__ = ["BColors", "ILogger", "LogEnum", "LogLevel"]
+    from ._string_parse import Site
+
+__all__ = ["BColors", "ILogFilter", "ILogger", "LogEnum", "LogLevel"]
 
 type LogLevel = Literal["NULL", "FATAL", "ERROR", "WARN", "BRIEF", "INFO", "DEBUG"]
 
@@ -39,15 +42,48 @@ class BColors(enum.StrEnum):
 
 
 class IHandler(abc.ABC):
+    ansi: ClassVar[bool] = True
+    """Whether the handler accepts ANSI escapes. Handlers that set this to False are given
+    the already stripped message through `emit` when dispatched to by a logger."""
+
     @abc.abstractmethod
     def __del__(self) -> None: ...
 
     @abc.abstractmethod
     def log(self, msg: str) -> None: ...
 
+    structured: ClassVar[bool] = False
+    """Whether the handler takes structured records. `StructLogger` passes such handlers the
+    raw record through `record` instead of the rendered text."""
+
+    def emit(self, msg: str) -> None:
+        self.log(msg)
+
+    def record(self, rec: Mapping[str, object]) -> None:
+        self.log(f"{rec.get('msg', '')}\n")
+
     @abc.abstractmethod
     def flush(self) -> None: ...
 
+    def close(self) -> None:
+        self.flush()
+
+
+class ILogFilter(abc.ABC):
+    """Decides whether a log call goes ahead, before its message is formatted.
+
+    `allow` receives the call site and the raw message arguments, which may still be
+    `Lazy`. Filters attached to a logger are also copied to the workers of a `LogListener`,
+    so they should be picklable.
+    """
+
+    @abc.abstractmethod
+    def allow(self, site: Site, msg: Sequence[object]) -> bool: ...
+
+    def drain(self) -> list[str]:
+        """Return and clear notes the filter wants logged, e.g. suppression summaries."""
+        return []
+
 
 class ILogger(abc.ABC):
     @property
@@ -60,9 +96,18 @@ class ILogger(abc.ABC):
     @abc.abstractmethod
     def console(self) -> bool: ...
     @abc.abstractmethod
+    def is_enabled_for(self, level: LogEnum) -> bool: ...
+    @abc.abstractmethod
     def add_handler(self, handler: IHandler | str | Path, *, name: str | None = None) -> None: ...
     @abc.abstractmethod
     def remove_handler(self, handler: IHandler | str) -> None: ...
+    @property
+    @abc.abstractmethod
+    def filters(self) -> Sequence[ILogFilter]: ...
+    @abc.abstractmethod
+    def add_filter(self, filt: ILogFilter) -> None: ...
+    @abc.abstractmethod
+    def remove_filter(self, filt: ILogFilter) -> None: ...
     @abc.abstractmethod
     def flush(self) -> None: ...
     @abc.abstractmethod
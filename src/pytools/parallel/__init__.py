@@ -1,3 +1,3 @@
-from ._parallel_exec import ThreadedRunner, ThreadMethods
+from ._parallel_exec import ThreadedRunner, ThreadMethods, parallel_exec
 
-__all__ = ["ThreadMethods", "ThreadedRunner"]
+__all__ = ["ThreadMethods", "ThreadedRunner", "parallel_exec"]
@@ -1,6 +1,11 @@
-from collections.abc import Callable
-from concurrent.futures import Future
-from typing import Protocol, Self, TypedDict, Unpack
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+from concurrent.futures import Executor, Future
+from typing import Any, Protocol, Self, TypedDict, Unpack
+
+__all__ = ["ThreadMethods", "ThreadedRunner", "parallel_exec"]
+
+type PExecArgs = tuple[Sequence[Any], Mapping[str, Any]]
+type PExecArgList = Iterable[PExecArgs]
 
 class _SupportNext(Protocol):
     def next(self) -> None: ...
@@ -10,13 +15,50 @@ class ThreadMethods(TypedDict, total=False):
     thread: int
     interpreter: int
 
+def parallel_exec(
+    exe: Executor,
+    func: Callable[..., Any],
+    args: PExecArgList,
+    *,
+    prog_bar: _SupportNext | None = None,
+    max_inflight: int | None = None,
+) -> None: ...
+
 class ThreadedRunner:
     def __init__(
-        self, *, prog_bar: _SupportNext | None = None, **kwargs: Unpack[ThreadMethods]
+        self,
+        *,
+        prog_bar: _SupportNext | None = None,
+        max_inflight: int | None = None,
+        **kwargs: Unpack[ThreadMethods],
     ) -> None: ...
     def __enter__(self) -> Self: ...
     def __exit__(self, *_args: object) -> None: ...
     def submit[**P, R](
         self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
     ) -> Future[R]: ...
+    def map[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        chunksize: int | None = None,
+        window: int | None = None,
+    ) -> list[R]: ...
+    def imap[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        chunksize: int | None = None,
+        window: int | None = None,
+    ) -> Generator[R]: ...
+    def imap_unordered[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        chunksize: int | None = None,
+        window: int | None = None,
+    ) -> Generator[R]: ...
     def wait_then_shutdown(self) -> None: ...
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Mapping, Sequence
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 from concurrent import futures
-from typing import Any, Protocol, Self, TypedDict, Unpack
+from typing import Any, Final, Protocol, Self, TypedDict, Unpack
 
-from pytools.logging import get_logger
+from pytools.logging import LogListener, get_logger, ship_profile
+from pytools.progress import SharedProgress, progress_job
 
 PExecArgs = tuple[Sequence[Any], Mapping[str, Any]]
 
 PExecArgList = Iterable[PExecArgs]
 
+_CHUNK_SECONDS: Final = 0.05
+"""Target duration of one chunk when the chunk size is tuned automatically."""
+_MAX_CHUNK: Final = 1 << 14
+
 
 class _SupportNext(Protocol):
     def next(self) -> None: ...
@@ -21,14 +30,98 @@ def parallel_exec(
     args: PExecArgList,
     *,
     prog_bar: _SupportNext | None = None,
+    max_inflight: int | None = None,
 ) -> None:
+    """Run `func` on every `(args, kwargs)` pair of `args` and wait for all of them.
+
+    Parameters
+    ----------
+    exe : futures.Executor
+        Executor to submit the jobs to.
+    func : Callable[..., Any]
+        Job function.
+    args : PExecArgList
+        Positional and keyword arguments of each job; may be a lazy iterator.
+    prog_bar : _SupportNext | None
+        Advanced once per completed job, instead of logging each completion.
+    max_inflight : int | None
+        Maximum number of jobs submitted but not yet completed. `args` is then only
+        consumed as jobs complete, so memory does not grow with the number of jobs. By
+        default every job is submitted up front.
+
+    """
+    if max_inflight is not None and max_inflight < 1:
+        msg = f"max_inflight must be positive, got {max_inflight}"
+        raise ValueError(msg)
     jobs: dict[futures.Future[Any], int] = {}
     logger = get_logger()
-    for i, (a, k) in enumerate(args):
+    source = enumerate(args)
+    for i, (a, k) in itertools.islice(source, max_inflight):
         jobs[exe.submit(func, *a, **k)] = i
-    for future in futures.as_completed(jobs):
-        future.result()
-        prog_bar.next() if prog_bar else logger.disp(f"<<< Completed {jobs[future]}")
+    while jobs:
+        done, _ = futures.wait(jobs, return_when=futures.FIRST_COMPLETED)
+        for future in done:
+            future.result()
+            prog_bar.next() if prog_bar else logger.disp(f"<<< Completed {jobs.pop(future)}")
+        for i, (a, k) in itertools.islice(source, len(done)):
+            jobs[exe.submit(func, *a, **k)] = i
+
+
+def _run_task[**P, R](func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    try:
+        with progress_job():
+            return func(*args, **kwargs)
+    finally:
+        ship_profile()
+        get_logger().flush()
+
+
+def _run_chunk[T, R](func: Callable[[T], R], items: Sequence[T]) -> tuple[list[R], float]:
+    start = time.perf_counter()
+    try:
+        return [func(x) for x in items], time.perf_counter() - start
+    finally:
+        ship_profile()
+        get_logger().flush()
+
+
+class _ChunkSizer:
+    """Pick chunk sizes so that each chunk takes about `_CHUNK_SECONDS`.
+
+    Starts from single items and grows by at most a factor of 4 per measured chunk, so a
+    few slow items at the start do not lead to one huge chunk.
+    """
+
+    __slots__ = ("fixed", "size")
+    fixed: bool
+    size: int
+
+    def __init__(self, chunksize: int | None) -> None:
+        if chunksize is not None and chunksize < 1:
+            msg = f"chunksize must be positive, got {chunksize}"
+            raise ValueError(msg)
+        self.fixed = chunksize is not None
+        self.size = chunksize or 1
+
+    def observe(self, n: int, elapsed: float) -> None:
+        if self.fixed or n == 0:
+            return
+        if elapsed <= 0:
+            self.size = min(_MAX_CHUNK, self.size * 4)
+            return
+        ideal = int(_CHUNK_SECONDS * n / elapsed)
+        self.size = max(1, min(_MAX_CHUNK, self.size * 4, ideal))
+
+
+def _init_process(
+    log_init: Callable[..., None],
+    log_args: Sequence[Any],
+    prog_init: Callable[..., None] | None,
+    prog_args: Sequence[Any],
+) -> None:
+    log_init(*log_args)
+    if prog_init is not None:
+        prog_init(*prog_args)
 
 
 class ThreadMethods(TypedDict, total=False):
@@ -39,24 +132,53 @@ class ThreadMethods(TypedDict, total=False):
 
 class ThreadedRunner:
     _exe: futures.Executor
+    _listener: LogListener
+    _shared: SharedProgress | None
+    _workers: int
     _futures: dict[futures.Future[Any], int]
     _counter: int
+    _inflight: int | None
+    _slots: threading.BoundedSemaphore | None
     prog_bar: _SupportNext | None
 
     def __init__(
-        self, *, prog_bar: _SupportNext | None = None, **kwargs: Unpack[ThreadMethods]
+        self,
+        *,
+        prog_bar: _SupportNext | None = None,
+        max_inflight: int | None = None,
+        **kwargs: Unpack[ThreadMethods],
     ) -> None:
+        if max_inflight is not None and max_inflight < 1:
+            msg = f"max_inflight must be positive, got {max_inflight}"
+            raise ValueError(msg)
+        self.prog_bar = prog_bar
+        # With a limit, `submit` blocks until a slot frees up and completed futures are
+        # reported as they are found, so a long producer loop runs in constant memory.
+        self._inflight = max_inflight
+        self._slots = None if max_inflight is None else threading.BoundedSemaphore(max_inflight)
+        # Workers advance a shared bar themselves, rather than once per completed future.
+        self._shared = prog_bar if isinstance(prog_bar, SharedProgress) else None
+        self._workers = 1
         if (n := kwargs.get("core")) is not None:
-            self._exe = futures.ProcessPoolExecutor(n)
+            self._workers = n
+            self._listener = LogListener(get_logger(), processes=True)
+            self._exe = self._process_pool(n)
         elif (n := kwargs.get("thread")) is not None:
+            self._workers = n
+            self._listener = LogListener(get_logger(), processes=False)
             self._exe = futures.ThreadPoolExecutor(n)
         elif (n := kwargs.get("interpreter")) is not None:
-            self._exe = futures.ProcessPoolExecutor(n)
+            self._workers = n
+            self._listener = LogListener(get_logger(), processes=True)
+            self._exe = self._process_pool(n)
         else:
+            self._listener = LogListener(get_logger(), processes=False)
             self._exe = futures.ThreadPoolExecutor(1)
+        self._listener.start()
+        if self._shared is not None:
+            self._shared.start()
         self._futures = {}
         self._counter = 0
-        self.prog_bar = prog_bar
 
     def __enter__(self) -> Self:
         return self
@@ -64,19 +186,149 @@ class ThreadedRunner:
     def __exit__(self, *_args: object) -> None:
         self.wait_then_shutdown()
 
+    def _process_pool(self, n: int) -> futures.ProcessPoolExecutor:
+        prog_init, prog_args = None, ()
+        if self._shared is not None:
+            self._shared.start(processes=True)
+            prog_init, prog_args = self._shared.initializer, self._shared.initargs
+        return futures.ProcessPoolExecutor(
+            n,
+            initializer=_init_process,
+            initargs=(self._listener.initializer, self._listener.initargs, prog_init, prog_args),
+        )
+
     def submit[**P, R](
         self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
     ) -> futures.Future[R]:
         self._counter += 1
-        future = self._exe.submit(func, *args, **kwargs)
+        if self._slots is None:
+            future = self._exe.submit(_run_task, func, *args, **kwargs)
+            self._futures[future] = self._counter
+            return future
+        self._slots.acquire()
+        try:
+            future = self._exe.submit(_run_task, func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release)
+        self._report_done()
         self._futures[future] = self._counter
         return future
 
+    def _release(self, _future: futures.Future[Any]) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def _report(self, future: futures.Future[Any], i: int) -> None:
+        if self._shared is not None:
+            future.result()
+            return
+        self.prog_bar.next() if self.prog_bar else get_logger().disp(
+            future.result() or f"<<< Completed {i} with message: {future.result()}"
+        )
+
+    def _report_done(self) -> None:
+        for future in [f for f in self._futures if f.done()]:
+            self._report(future, self._futures.pop(future))
+
+    def map[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        chunksize: int | None = None,
+        window: int | None = None,
+    ) -> list[R]:
+        """Apply `func` to every item and return the results in order. See `imap`."""
+        return list(self.imap(func, items, chunksize=chunksize, window=window))
+
+    def imap[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        chunksize: int | None = None,
+        window: int | None = None,
+    ) -> Generator[R]:
+        """Apply `func` to every item, yielding results in the order of `items`.
+
+        Items are sent to the workers in chunks, with one future per chunk, and `items` is
+        only consumed as far as needed to keep `window` chunks in flight.
+
+        Parameters
+        ----------
+        func : Callable[[T], R]
+            Function of one item. Must be picklable for process pools.
+        items : Iterable[T]
+            Items to process; may be a lazy iterator.
+        chunksize : int | None
+            Items per chunk. By default it is tuned from the measured duration of the
+            chunks, aiming at about 50 ms per chunk.
+        window : int | None
+            Maximum number of chunks in flight, by default the runner's `max_inflight`
+            or else twice the number of workers.
+
+        Returns
+        -------
+        Generator[R]
+            Results of `func`. Closing the generator cancels the chunks not yet started.
+
+        """
+        return self._stream(func, items, chunksize, window, ordered=True)
+
+    def imap_unordered[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        chunksize: int | None = None,
+        window: int | None = None,
+    ) -> Generator[R]:
+        """Like `imap`, but yield the results of each chunk as soon as it completes."""
+        return self._stream(func, items, chunksize, window, ordered=False)
+
+    def _stream[T, R](
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        chunksize: int | None,
+        window: int | None,
+        *,
+        ordered: bool,
+    ) -> Generator[R]:
+        sizer = _ChunkSizer(chunksize)
+        window = window or self._inflight or 2 * self._workers
+        source = iter(items)
+        pending: deque[futures.Future[tuple[list[R], float]]] = deque()
+
+        def fill() -> None:
+            while len(pending) < window and (chunk := list(itertools.islice(source, sizer.size))):
+                pending.append(self._exe.submit(_run_chunk, func, chunk))
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                    future = next(f for f in pending if f in done)
+                    pending.remove(future)
+                results, elapsed = future.result()
+                sizer.observe(len(results), elapsed)
+                # Refill before handing results out, so workers stay busy meanwhile.
+                fill()
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
     def wait_then_shutdown(self) -> None:
-        logger = get_logger()
         for future in futures.as_completed(self._futures):
-            self.prog_bar.next() if self.prog_bar else logger.disp(
-                future.result()
-                or f"<<< Completed {self._futures[future]} with message: {future.result()}"
-            )
+            self._report(future, self._futures[future])
+        self._futures.clear()
         self._exe.shutdown()
+        self._listener.stop()
+        if self._shared is not None:
+            self._shared.stop()
@@ -19,11 +19,16 @@ from pydantic import BaseModel, ValidationError
 from pytools.logging import LogEnum, LogLevel, get_logger
 from pytools.parallel import ThreadedRunner
 from pytools.path import expand_as_path
+from pytools.progress import MultiProgress, ProgressReader
 from pytools.result import Err, Ok, Result
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
 
+    from _typeshed import SupportsRead
+
+    from pytools.progress import TaskProgress
+
 
 type Filter = Literal["MACOS", "GIT", "PYTHON", "HIDDEN", "LOG", "DATA", "DEFAULT"]
 type CompressionMode = Literal["gz", "xz"]
@@ -102,6 +107,8 @@ class KwargsModel(BaseModel):
 
 class APIArgs(NamedTuple):
     names: Sequence[str]
+
+
 class APIKwargs(TypedDict, total=False):
     output_dir: Path
     exclude: Sequence[Filter] | None
@@ -152,23 +159,55 @@ _COMPRESSION_MODES: Mapping[CompressionMode, _COMPRESSION_TYPES] = {
 }
 
 
+class _ProgressTarFile(tarfile.TarFile):
+    """TarFile that reports the bytes of each member it reads to `progress`."""
+
+    progress: TaskProgress | None = None
+
+    def addfile(self, tarinfo: tarfile.TarInfo, fileobj: SupportsRead[bytes] | None = None) -> None:
+        if fileobj is not None and self.progress is not None:
+            fileobj = ProgressReader(fileobj, self.progress)
+        super().addfile(tarinfo, fileobj)
+
+
+def tree_size(item: Path) -> int:
+    if item.is_file():
+        return item.stat().st_size
+    return sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
+
+
 def compress(
-    output_file: Path, *input_dir: Path, mode: CompressionMode, filt: ArchiveFilter
+    output_file: Path,
+    *input_dir: Path,
+    mode: CompressionMode,
+    filt: ArchiveFilter,
+    progress: TaskProgress | None = None,
 ) -> None:
-    with tarfile.open(output_file.with_suffix(f".tar.{mode}"), _COMPRESSION_MODES[mode]) as tar:
+    with _ProgressTarFile.open(
+        output_file.with_suffix(f".tar.{mode}"), _COMPRESSION_MODES[mode]
+    ) as tar:
+        tar.progress = progress
         for folder in input_dir:
             tar.add(folder, filter=filt)
 
 
 def archive_core(
-    output_dir: Path, input_item: Path, filt: ArchiveFilter, mode: CompressionMode
+    output_dir: Path,
+    input_item: Path,
+    filt: ArchiveFilter,
+    mode: CompressionMode,
+    progress: TaskProgress | None = None,
 ) -> str:
-    if input_item.is_file():
-        sh.copy2(input_item, output_dir / input_item.name)
-        return f"Input {input_item} is a file, copied ...\n"
-    archive_file = output_dir / input_item.stem
-    compress(archive_file, input_item, filt=filt, mode=mode)
-    return f"Archive for {input_item} created successfully.\n"
+    try:
+        if input_item.is_file():
+            sh.copy2(input_item, output_dir / input_item.name)
+            return f"Input {input_item} is a file, copied ...\n"
+        archive_file = output_dir / input_item.stem
+        compress(archive_file, input_item, filt=filt, mode=mode, progress=progress)
+        return f"Archive for {input_item} created successfully.\n"
+    finally:
+        if progress is not None:
+            progress.finish()
 
 
 def compose_program_args(
@@ -215,7 +254,10 @@ def archive_api(*names: str | Path, **kwargs: Unpack[APIKwargs]) -> Result[None]
         log.info(">>> Dry run complete. No archives were created.")
         return Ok(None)
     if threads := kwargs.get("thread"):
-        with ThreadedRunner(thread=threads) as runner:
+        with (
+            MultiProgress(len(items), "Archives") as multi,
+            ThreadedRunner(thread=threads, prog_bar=multi) as runner,
+        ):
             for input_item in items:
                 runner.submit(
                     archive_core,
@@ -223,8 +265,9 @@ def archive_api(*names: str | Path, **kwargs: Unpack[APIKwargs]) -> Result[None]
                     input_item,
                     filt=item_filter,
                     mode=kwargs.get("type", "gz"),
+                    progress=multi.task(input_item.name, tree_size(input_item)),
                 )
-                log.info(f"Archive for {input_item} submitted.\n")
+                log.debug(f"Archive for {input_item} submitted.\n")
     else:
         for input_item in items:
             log.info(f"Compressing {(output_dir / input_item.stem).with_suffix('.tar.gz')}\n")
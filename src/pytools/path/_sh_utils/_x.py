@@ -5,10 +5,12 @@ from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Literal,
     TypeAliasType,
     TypedDict,
     Unpack,
+    cast,
     get_args,
 )
 
@@ -17,11 +19,14 @@ from pydantic import BaseModel, ValidationError
 from pytools.logging import LogLevel, get_logger
 from pytools.parallel import ThreadedRunner
 from pytools.path import expand_as_path
+from pytools.progress import MultiProgress, ProgressReader
 from pytools.result import Err, Ok, Result
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
 
+    from pytools.progress import TaskProgress
+
 
 type Filter = Literal["MACOS", "GIT", "PYTHON", "HIDDEN", "LOG", "DATA", "DEFAULT"]
 
@@ -102,16 +107,23 @@ def compose_program_args(archives: Mapping[Path, Path]) -> list[object]:
     ]
 
 
-def extract_core(output_dir: Path, input_item: Path) -> str:
-    if input_item.suffixes == [".tar", ".gz"]:
-        with tarfile.open(input_item, "r:gz") as tar:
-            tar.extractall(output_dir, filter="data")
-        return f"Tar Gzip Archive {input_item} extracted successfully.\n"
-    if input_item.suffix == ".zip":
-        msg = "Zip file extraction is not implemented yet."
-        raise NotImplementedError(msg)
-    sh.copy2(input_item, output_dir / input_item.name)
-    return f"Input {input_item} is a file, copied ...\n"
+def extract_core(output_dir: Path, input_item: Path, progress: TaskProgress | None = None) -> str:
+    try:
+        if input_item.suffixes == [".tar", ".gz"]:
+            with input_item.open("rb") as raw:
+                # Progress is measured on the compressed bytes, so it matches the file size.
+                src = raw if progress is None else cast("BinaryIO", ProgressReader(raw, progress))
+                with tarfile.open(fileobj=src, mode="r:gz") as tar:
+                    tar.extractall(output_dir, filter="data")
+            return f"Tar Gzip Archive {input_item} extracted successfully.\n"
+        if input_item.suffix == ".zip":
+            msg = "Zip file extraction is not implemented yet."
+            raise NotImplementedError(msg)
+        sh.copy2(input_item, output_dir / input_item.name)
+        return f"Input {input_item} is a file, copied ...\n"
+    finally:
+        if progress is not None:
+            progress.finish()
 
 
 def extract_api(files: Sequence[Path], **kwargs: Unpack[XKwargs]) -> Result[None]:
@@ -124,7 +136,6 @@ def extract_api(files: Sequence[Path], **kwargs: Unpack[XKwargs]) -> Result[None
         msg = f"Output directory: {output_dir} was not found!"
         return Err(ValueError(msg))
     items = expand_as_path(files)
-    items = [i for i in items if not i.name.endswith(".tar.gz")]
     if kwargs.get("dir_only"):
         items = [i for i in items if i.is_dir()]
     if not items:
@@ -137,10 +148,14 @@ def extract_api(files: Sequence[Path], **kwargs: Unpack[XKwargs]) -> Result[None
         log.info(">>> Dry run complete. No archives were created.")
         return Ok(None)
     if threads := kwargs.get("thread"):
-        with ThreadedRunner(thread=threads) as runner:
+        with (
+            MultiProgress(len(items), "Archives") as multi,
+            ThreadedRunner(thread=threads, prog_bar=multi) as runner,
+        ):
             for input_item in items:
-                runner.submit(extract_core, output_dir, input_item)
-                log.info(f"Archive for {input_item} submitted.\n")
+                task = multi.task(input_item.name, input_item.stat().st_size)
+                runner.submit(extract_core, output_dir, input_item, progress=task)
+                log.debug(f"Archive for {input_item} submitted.\n")
     else:
         for input_item in items:
             log.info(f"Extracting {input_item}")
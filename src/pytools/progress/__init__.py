@@ -1,3 +1,15 @@
+from ._multi import MultiProgress, ProgressReader, TaskProgress
 from ._progress_bar import ProgressBar
+from ._shared import JobProgress, SharedProgress, install_progress, job_progress, progress_job
 
-__all__ = ["ProgressBar"]
+__all__ = [
+    "JobProgress",
+    "MultiProgress",
+    "ProgressBar",
+    "ProgressReader",
+    "SharedProgress",
+    "TaskProgress",
+    "install_progress",
+    "job_progress",
+    "progress_job",
+]
@@ -1,16 +1,101 @@
-from typing import Literal, TypedDict, Unpack
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from typing import Literal, Self, TextIO, TypedDict, Unpack
+
+from _typeshed import SupportsRead
+
+from ._multi import TaskState
+from ._shared import SharedCounter
 
 class PBarKwargs(TypedDict, total=False):
     length: int
     decimal: int
     pixel: str
     end: Literal["\n", "\r", ""]
+    interval: float
+    unit: str
 
 class ProgressBar:
+    i: float
+    p: float
+    rate: float
+    bar: str
     def __init__(
         self, n: int, prefix: str = "", suffix: str = "", **kwargs: Unpack[PBarKwargs]
     ) -> None: ...
     def reset(self) -> None: ...
+    @property
+    def eta(self) -> float: ...
     def next(self) -> None: ...
+    def update(self, k: float) -> None: ...
+    def refresh(self) -> None: ...
+    def line(self) -> str: ...
     def finish(self) -> None: ...
     def _print_bar(self) -> None: ...
+
+class JobProgress:
+    @property
+    def parts(self) -> int: ...
+    @parts.setter
+    def parts(self, parts: int) -> None: ...
+    def advance(self, k: int = 1) -> None: ...
+    def complete(self) -> None: ...
+
+class SharedProgress:
+    def __init__(
+        self, n: int, prefix: str = "", suffix: str = "", **kwargs: Unpack[PBarKwargs]
+    ) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(self, *_args: object) -> None: ...
+    @property
+    def done(self) -> float: ...
+    @property
+    def initializer(self) -> Callable[[SharedCounter | None], None]: ...
+    @property
+    def initargs(self) -> tuple[SharedCounter | None]: ...
+    def next(self) -> None: ...
+    def start(self, *, processes: bool = False) -> Self: ...
+    def stop(self) -> None: ...
+
+def install_progress(counter: SharedCounter | None) -> None: ...
+def progress_job() -> AbstractContextManager[JobProgress]: ...
+def job_progress(parts: int | None = None) -> JobProgress: ...
+
+class TaskProgress:
+    name: str
+    total: int
+    done: int
+    state: TaskState
+    @property
+    def fraction(self) -> float: ...
+    def start(self) -> None: ...
+    def update(self, k: int) -> None: ...
+    def finish(self) -> None: ...
+    def line(self) -> str: ...
+
+class ProgressReader:
+    def __init__(self, f: SupportsRead[bytes], progress: TaskProgress) -> None: ...
+    def __getattr__(self, name: str) -> object: ...
+    def read(self, size: int = -1, /) -> bytes: ...
+
+class MultiProgress:
+    n: int
+    unit: str
+    def __init__(
+        self,
+        n: int,
+        prefix: str = "Total",
+        *,
+        interval: float = 0.1,
+        summary_interval: float = 10.0,
+        unit: str = "B",
+        stream: TextIO | None = None,
+    ) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(self, *_args: object) -> None: ...
+    @property
+    def completed(self) -> int: ...
+    def next(self) -> None: ...
+    def task(self, name: str, total: int) -> TaskProgress: ...
+    def start(self) -> Self: ...
+    def stop(self) -> None: ...
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Final, Literal, Self
+
+from ._progress_bar import ProgressBar
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+    from _typeshed import SupportsRead
+
+__all__ = ["MultiProgress", "ProgressReader", "TaskProgress"]
+
+_UP: Final = "\033[{}F"
+_CLEAR_LINE: Final = "\033[2K"
+_CLEAR_BELOW: Final = "\033[J"
+
+type TaskState = Literal["pending", "active", "done"]
+
+
+class TaskProgress:
+    """Progress of one task of a `MultiProgress`.
+
+    `update` only adds to a counter, so it is cheap enough to call for every block of
+    bytes; the bar itself is drawn by the `MultiProgress` thread.
+    """
+
+    __slots__ = ("_bar", "done", "name", "state", "total")
+    name: str
+    total: int
+    done: int
+    state: TaskState
+    _bar: ProgressBar
+
+    def __init__(self, name: str, total: int, *, width: int, unit: str) -> None:
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.state = "pending"
+        label = name if len(name) <= width else "..." + name[3 - width :]
+        self._bar = ProgressBar(max(total, 1), f"{label:<{width}} ", length=30, unit=unit)
+
+    def __repr__(self) -> str:
+        return f"<TaskProgress {self.name!r} {self.done}/{self.total} {self.state}>"
+
+    @property
+    def fraction(self) -> float:
+        match self.state:
+            case "pending":
+                return 0.0
+            case "done":
+                return 1.0
+            case "active":
+                return min(1.0, self.done / self.total) if self.total > 0 else 0.0
+
+    def start(self) -> None:
+        if self.state == "pending":
+            self.state = "active"
+
+    def update(self, k: int) -> None:
+        self.done += k
+        if self.state == "pending":
+            self.state = "active"
+
+    def finish(self) -> None:
+        self.state = "done"
+
+    def line(self) -> str:
+        self._bar.i = min(self.done, self.total)
+        return self._bar.line()
+
+
+class ProgressReader:
+    """Binary file wrapper that reports the bytes read to a `TaskProgress`."""
+
+    __slots__ = ("_f", "_progress")
+    _f: SupportsRead[bytes]
+    _progress: TaskProgress
+
+    def __init__(self, f: SupportsRead[bytes], progress: TaskProgress) -> None:
+        self._f = f
+        self._progress = progress
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._f, name)
+
+    def read(self, size: int = -1, /) -> bytes:
+        data = self._f.read(size)
+        self._progress.update(len(data))
+        return data
+
+
+class MultiProgress:
+    """Progress display with an overall bar and one bar per active task.
+
+    On a terminal the bars are redrawn in place every `interval` seconds using cursor
+    movement escapes. Otherwise a single summary line is written every
+    `summary_interval` seconds, so that captured logs stay short.
+
+    Parameters
+    ----------
+    n : int
+        Number of tasks in total.
+    prefix : str
+        Label of the overall bar.
+    interval : float
+        Seconds between redraws on a terminal.
+    summary_interval : float
+        Seconds between summary lines when not on a terminal.
+    unit : str
+        Unit of the task counts, e.g. `"B"` for bytes.
+    stream : TextIO | None
+        Output stream, by default `sys.stdout`.
+
+    Examples
+    --------
+    >>> with MultiProgress(len(files)) as multi, ThreadedRunner(thread=4) as runner:
+    ...     for f in files:
+    ...         runner.submit(copy, f, progress=multi.task(f.name, f.stat().st_size))
+
+    """
+
+    __slots__ = (
+        "_drawn",
+        "_interval",
+        "_last_summary",
+        "_overall",
+        "_stop",
+        "_stream",
+        "_summary_interval",
+        "_tasks",
+        "_thread",
+        "_tty",
+        "_width",
+        "n",
+        "unit",
+    )
+    n: int
+    unit: str
+    _overall: ProgressBar
+    _tasks: list[TaskProgress]
+    _stream: TextIO
+    _tty: bool
+    _interval: float
+    _summary_interval: float
+    _last_summary: float
+    _drawn: int
+    _width: int
+    _stop: threading.Event
+    _thread: threading.Thread | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        n: int,
+        prefix: str = "Total",
+        *,
+        interval: float = 0.1,
+        summary_interval: float = 10.0,
+        unit: str = "B",
+        stream: TextIO | None = None,
+    ) -> None:
+        self.n = n
+        self.unit = unit
+        self._width = 24
+        self._overall = ProgressBar(max(n, 1), f"{prefix:<{self._width}} ", length=30, unit="task")
+        self._tasks = []
+        self._stream = sys.stdout if stream is None else stream
+        self._tty = self._stream.isatty()
+        self._interval = interval
+        self._summary_interval = summary_interval
+        self._last_summary = time.monotonic()
+        self._drawn = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *_args: object) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<MultiProgress {self.completed}/{self.n} tty={self._tty}>"
+
+    @property
+    def completed(self) -> int:
+        return sum(t.state == "done" for t in list(self._tasks))
+
+    def next(self) -> None:
+        """Accept a finished job from `ThreadedRunner`.
+
+        Completion is tracked through each task instead, so passing this display as
+        `prog_bar` only keeps the runner from logging every result over the bars.
+        """
+
+    def task(self, name: str, total: int) -> TaskProgress:
+        """Register a task of `total` units, shown once it starts reporting progress."""
+        task = TaskProgress(name, total, width=self._width, unit=self.unit)
+        self._tasks.append(task)
+        return task
+
+    def start(self) -> Self:
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MultiProgress", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            stopping = self._stop.wait(self._interval)
+            if self._tty:
+                self._redraw()
+            elif stopping or time.monotonic() - self._last_summary >= self._summary_interval:
+                self._summary()
+            if stopping:
+                return
+
+    def _overall_line(self, tasks: list[TaskProgress]) -> str:
+        self._overall.i = sum(t.fraction for t in tasks)
+        return self._overall.line()
+
+    def _redraw(self) -> None:
+        tasks = list(self._tasks)
+        lines = [self._overall_line(tasks)]
+        lines.extend(t.line() for t in tasks if t.state == "active")
+        out = [_UP.format(self._drawn)] if self._drawn else []
+        out.extend(f"{_CLEAR_LINE}{line}\n" for line in lines)
+        out.append(_CLEAR_BELOW)
+        self._drawn = len(lines)
+        self._stream.write("".join(out))
+        self._stream.flush()
+
+    def _summary(self) -> None:
+        self._last_summary = time.monotonic()
+        tasks = list(self._tasks)
+        active = sum(t.state == "active" for t in tasks)
+        done = sum(t.state == "done" for t in tasks)
+        self._stream.write(
+            f"{self._overall_line(tasks).strip()} [{done}/{self.n} done, {active} running]\n"
+        )
+        self._stream.flush()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import sys
+import time
 from typing import Final, Literal, TypedDict, Unpack
 
 __all__ = ["ProgressBar"]
 
+_SMOOTHING: Final = 0.3
+_SI: Final = ((1e9, "G"), (1e6, "M"), (1e3, "k"))
+
 
 class PBarKwargs(TypedDict, total=False):
     """Keyword arguments for the ProgressBar class."""
@@ -13,25 +17,56 @@ class PBarKwargs(TypedDict, total=False):
     decimal: int
     pixel: str
     end: Literal["\n", "\r", ""]
+    interval: float
+    unit: str
+
+
+def _fmt_rate(rate: float, unit: str) -> str:
+    for scale, prefix in _SI:
+        if rate >= scale:
+            return f"{rate / scale:.2f}{prefix} {unit}/s"
+    return f"{rate:.2f} {unit}/s"
+
+
+def _fmt_eta(seconds: float) -> str:
+    if seconds == float("inf"):
+        return "--:--"
+    m, s = divmod(int(seconds + 0.5), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
 
 
 class ProgressBar:
+    """Text progress bar showing the rate of progress and the time remaining.
+
+    The bar is redrawn at most once per `interval` seconds. Between redraws, `next` and
+    `update` only compare the item count against a precomputed target, derived from the
+    smoothed rate, at which the clock is checked again.
+    """
+
     __slots__ = [
         "_bdiv",
         "_bmt",
-        "_dec",
+        "_due",
         "_endl",
+        "_interval",
         "_l",
+        "_last_i",
+        "_last_t",
+        "_len",
         "_n",
+        "_next_t",
         "_pdiv",
         "_pfx",
         "_pmt",
         "_sfx",
+        "_unit",
         "_x",
         "b",
         "bar",
         "i",
         "p",
+        "rate",
     ]
 
     _x: Final[str]
@@ -44,10 +79,17 @@ class ProgressBar:
     _pmt: Final[str]
     _bdiv: Final[float]
     _pdiv: Final[float]
-    _dec: Final[float]
+    _interval: Final[float]
+    _unit: Final[str]
+    _len: Final[int]
+    _due: float
+    _next_t: float
+    _last_t: float
+    _last_i: float
     b: int
-    i: int
+    i: float
     p: float
+    rate: float
     bar: str
 
     def __init__(
@@ -68,34 +110,80 @@ class ProgressBar:
         self._bmt = f"-<{self._l}"
         self._pmt = f">{5 + decimal}.{decimal}%"
         self._endl = kwargs.get("end", "\r")
-        self.bar = f"{self._pfx}|{' ':{self._bmt}}|"
-        self._dec = 0.01 * 0.1**decimal
+        self._interval = kwargs.get("interval", 0.1)
+        self._unit = kwargs.get("unit", "it")
+        self._len = length
+        self.reset()
 
     def reset(self) -> None:
         self.i = 0
         self.p = 0
         self.b = 0
+        self.rate = 0.0
         self.bar = f"{self._pfx}|{' ':{self._bmt}}|"
+        self._last_t = time.monotonic()
+        self._last_i = 0
+        self._next_t = self._last_t + self._interval
+        self._due = 1
+
+    @property
+    def eta(self) -> float:
+        """Estimated seconds until `n` items are done, from the smoothed rate."""
+        return (self._n - self.i) / self.rate if self.rate > 0 else float("inf")
 
     def next(self) -> None:
-        self.i = self.i + 1
+        self.i += 1
+        if self.i >= self._due:
+            self._tick()
+
+    def update(self, k: float) -> None:
+        """Advance by `k` items at once; fractions of an item are allowed."""
+        self.i += k
+        if self.i >= self._due:
+            self._tick()
+
+    def refresh(self) -> None:
+        """Redraw now, regardless of the interval."""
         self._print_bar()
 
     def finish(self) -> None:
-        self._print_bar()
+        self.refresh()
 
-    def _print_bar(self) -> None:
-        p = self._pdiv * self.i
-        if (p - self.p) < self._dec:
+    def _measure(self, now: float) -> None:
+        if (dt := now - self._last_t) <= 0 or self.i == self._last_i:
+            return
+        inst = (self.i - self._last_i) / dt
+        self.rate = inst if self.rate == 0 else _SMOOTHING * inst + (1 - _SMOOTHING) * self.rate
+        self._last_t, self._last_i = now, self.i
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        if self.i >= self._n:
+            self._print_bar()
+            self._due = sys.maxsize
             return
+        if now >= self._next_t:
+            self._print_bar()
+            self._next_t = now + self._interval
+        # Items expected before the next redraw is due; the clock is not read until then.
+        ahead = int(self.rate * (self._next_t - now)) if self.rate > 0 else 0
+        self._due = min(self.i + max(1, ahead), self._n)
+
+    def line(self) -> str:
+        """Update the rate estimate and return the bar as text, without writing it."""
+        self._measure(time.monotonic())
+        p = self._pdiv * self.i
         self.p = p
-        b = int(self._bdiv * self.i)
+        b = min(int(self._bdiv * self.i), self._len)
         if self.b != b:
             self.b = b
             self.bar = f"{self._pfx}|{self._x * b:{self._bmt}}|"
+        rate = _fmt_rate(self.rate, self._unit)
+        return f"{self.bar}{p:{self._pmt}} {rate} ETA {_fmt_eta(self.eta)}{self._sfx}"
+
+    def _print_bar(self) -> None:
         sys.stdout.write(self._endl)
-        sys.stdout.write(self.bar)
-        sys.stdout.write(f"{p:{self._pmt}}{self._sfx}")
+        sys.stdout.write(self.line())
         if self.i >= self._n:
             sys.stdout.write("\n")
         sys.stdout.flush()
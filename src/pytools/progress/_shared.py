@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import threading
+from typing import TYPE_CHECKING, Final, Protocol, Self, Unpack
+
+from ._progress_bar import PBarKwargs, ProgressBar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+__all__ = ["JobProgress", "SharedProgress", "install_progress", "job_progress", "progress_job"]
+
+SCALE: Final = 1 << 20
+"""Fixed-point ticks per job of the shared counter."""
+_PUSH: Final = SCALE >> 8
+
+
+class SharedCounter(Protocol):
+    """Integer counter guarded by a lock, e.g. a `multiprocessing.Value`."""
+
+    value: int
+
+    def get_lock(self) -> contextlib.AbstractContextManager[object]: ...
+
+
+class _ThreadCounter:
+    """Same interface as `multiprocessing.Value`, for use within one process."""
+
+    __slots__ = ("_lock", "value")
+    value: int
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def get_lock(self) -> threading.Lock:
+        return self._lock
+
+
+def _add(counter: SharedCounter, ticks: int) -> None:
+    with counter.get_lock():
+        counter.value += ticks
+
+
+_COUNTERS: Final[list[SharedCounter]] = []
+_LOCAL: Final = threading.local()
+
+
+class JobProgress:
+    """Progress within the current job, split into `parts` steps.
+
+    Steps are rolled up into the shared total as fractions of one job; the job is counted
+    as complete when it returns, however many steps were reported.
+    """
+
+    __slots__ = ("_counter", "_done", "_parts", "_pending", "_sent")
+    _counter: SharedCounter | None
+    _parts: int
+    _done: int
+    _sent: int
+    _pending: int
+
+    def __init__(self, counter: SharedCounter | None, parts: int = 1) -> None:
+        self._counter = counter
+        self._parts = max(1, parts)
+        self._done = 0
+        self._sent = 0
+        self._pending = 0
+
+    def __repr__(self) -> str:
+        return f"<JobProgress {self._done}/{self._parts}>"
+
+    @property
+    def parts(self) -> int:
+        return self._parts
+
+    @parts.setter
+    def parts(self, parts: int) -> None:
+        self._parts = max(1, parts)
+
+    def advance(self, k: int = 1) -> None:
+        if self._counter is None:
+            return
+        self._done = min(self._parts, self._done + k)
+        ticks = self._done * SCALE // self._parts - self._sent - self._pending
+        self._pending += ticks
+        # Batch small steps so a job takes the counter's lock a bounded number of times.
+        if self._pending >= _PUSH:
+            self._flush()
+
+    def complete(self) -> None:
+        if self._counter is None:
+            return
+        self._pending = SCALE - self._sent
+        self._flush()
+
+    def _flush(self) -> None:
+        if self._counter is None or self._pending <= 0:
+            return
+        _add(self._counter, self._pending)
+        self._sent += self._pending
+        self._pending = 0
+
+
+def install_progress(counter: SharedCounter | None) -> None:
+    """Route `job_progress` in this process to `counter`.
+
+    Used as part of the pool initializer of `ThreadedRunner` with a `SharedProgress`.
+    """
+    if counter is not None:
+        _COUNTERS.append(counter)
+
+
+@contextlib.contextmanager
+def progress_job() -> Generator[JobProgress]:
+    """Run one job of the active `SharedProgress`, completing it on exit."""
+    job = JobProgress(_COUNTERS[-1] if _COUNTERS else None)
+    prev = getattr(_LOCAL, "job", None)
+    _LOCAL.job = job
+    try:
+        yield job
+    finally:
+        _LOCAL.job = prev
+        job.complete()
+
+
+def job_progress(parts: int | None = None) -> JobProgress:
+    """Return the progress handle of the job running in this thread.
+
+    Parameters
+    ----------
+    parts : int | None
+        Number of steps the job will report through `advance`.
+
+    Returns
+    -------
+    JobProgress
+        Handle for the current job; one that does nothing if no `SharedProgress` is
+        active.
+
+    """
+    job: JobProgress | None = getattr(_LOCAL, "job", None)
+    if job is None:
+        return JobProgress(None)
+    if parts is not None:
+        job.parts = parts
+    return job
+
+
+class SharedProgress:
+    """Progress bar over `n` jobs that workers update directly.
+
+    Workers report steps through `job_progress` into a shared counter: a locked integer
+    for thread pools, or a `multiprocessing.Value` when started with `processes=True`, in
+    which case process pools must be created with `initializer` and `initargs`. A single
+    thread in this process redraws the bar. `ThreadedRunner` does all of this when given a
+    `SharedProgress` as `prog_bar`.
+
+    Examples
+    --------
+    >>> def work(items):
+    ...     job = job_progress(len(items))
+    ...     for x in items:
+    ...         process(x)
+    ...         job.advance()
+    >>> with ThreadedRunner(core=4, prog_bar=SharedProgress(len(chunks))) as runner:
+    ...     for chunk in chunks:
+    ...         runner.submit(work, chunk)
+
+    """
+
+    __slots__ = ("_bar", "_counter", "_interval", "_n", "_stop", "_thread")
+    _n: int
+    _bar: ProgressBar
+    _counter: SharedCounter
+    _interval: float
+    _stop: threading.Event
+    _thread: threading.Thread | None
+
+    def __init__(
+        self,
+        n: int,
+        prefix: str = "",
+        suffix: str = "",
+        **kwargs: Unpack[PBarKwargs],
+    ) -> None:
+        self._n = n
+        self._interval = kwargs.get("interval", 0.1)
+        self._bar = ProgressBar(n, prefix, suffix, **kwargs)
+        self._counter = _ThreadCounter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *_args: object) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<SharedProgress {self.done:.2f}/{self._n}>"
+
+    @property
+    def done(self) -> float:
+        """Jobs completed so far, including fractions of running jobs."""
+        return self._counter.value / SCALE
+
+    @property
+    def initializer(self) -> Callable[[SharedCounter | None], None]:
+        return install_progress
+
+    @property
+    def initargs(self) -> tuple[SharedCounter | None]:
+        return (self._counter,)
+
+    def next(self) -> None:
+        """Count one whole job from this process."""
+        _add(self._counter, SCALE)
+
+    def start(self, *, processes: bool = False) -> Self:
+        """Start redrawing the bar, with a counter shared with worker processes if asked."""
+        if self._thread is not None:
+            return self
+        if processes and isinstance(self._counter, _ThreadCounter):
+            counter = multiprocessing.Value("q", self._counter.value)
+            self._counter = counter
+        _COUNTERS.append(self._counter)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SharedProgress", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._counter in _COUNTERS:
+            _COUNTERS.remove(self._counter)
+
+    def _run(self) -> None:
+        shown = -1
+        while True:
+            stopping = self._stop.wait(self._interval)
+            ticks = self._counter.value
+            if ticks != shown:
+                shown = ticks
+                self._bar.i = ticks / SCALE
+                self._bar.refresh()
+            if stopping:
+                return
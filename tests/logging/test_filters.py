@@ -0,0 +1,76 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+from pytools.logging import Dedup, IHandler, Lazy, RateLimit, Sample
+from pytools.logging._queue_logger import LogListener
+from pytools.logging._struct_logger import StructLogger
+
+
+class ListHandler(IHandler):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self.messages.append(msg)
+
+    def flush(self) -> None: ...
+
+
+def make_logger() -> tuple[StructLogger, ListHandler]:
+    handler = ListHandler()
+    logger = StructLogger("DEBUG", stdout=False, header=False)
+    logger.add_handler(handler)
+    return logger, handler
+
+
+def test_rate_limit_is_per_call_site() -> None:
+    logger, handler = make_logger()
+    logger.add_filter(RateLimit(1e-6, burst=2))
+    for i in range(100):
+        logger.debug(f"a {i}")
+        logger.disp(f"b {i}")
+    assert handler.messages == ["a 0\n", "b 0\n", "a 1\n", "b 1\n"]
+
+
+def test_sample_skips_formatting() -> None:
+    calls: list[int] = []
+    logger, handler = make_logger()
+    logger.add_filter(Sample(10))
+    for i in range(100):
+        logger.info(Lazy(lambda i: calls.append(i) or i, i))
+    assert calls == list(range(0, 100, 10))
+    assert len(handler.messages) == 10
+
+
+def test_dedup_summarizes_repeats() -> None:
+    logger, handler = make_logger()
+    dedup = Dedup()
+    logger.add_filter(dedup)
+    for _ in range(5):
+        logger.brief("same")
+    for _ in range(2):
+        logger.brief("other")
+    logger.flush()
+    assert handler.messages[0] == "same\n"
+    assert "repeated 4 more times" in handler.messages[1]
+    assert handler.messages[2] == "other\n"
+    assert "repeated 1 more times" in handler.messages[3]
+    logger.remove_filter(dedup)
+    logger.brief("other")
+    assert handler.messages[-1] == "other\n"
+
+
+def test_listener_records_are_not_filtered_again() -> None:
+    logger, handler = make_logger()
+    logger.add_filter(Sample(1000))
+    with LogListener(logger, processes=False) as listener:
+        q = listener.initargs[0]
+        assert q is not None
+        q.put([f"worker {i}\n" for i in range(5)])
+    assert handler.messages == [f"worker {i}\n" for i in range(5)]
@@ -0,0 +1,87 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+from pytools.logging import (
+    BColors,
+    FileHandler,
+    IHandler,
+    QueuedFileHandler,
+    RotatingFileHandler,
+)
+from pytools.logging._handlers import dispatch
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_file_handler_strips_ansi(tmp_path: Path) -> None:
+    file = tmp_path / "sync.log"
+    handler = FileHandler(file)
+    handler.log(f"{BColors.OKBLUE}hello{BColors.ENDC}\r")
+    handler.close()
+    handler.close()
+    text = file.read_text(encoding="utf-8")
+    assert "hello\n" in text
+    assert "\033" not in text
+
+
+def test_queued_handler_flush(tmp_path: Path) -> None:
+    file = tmp_path / "queued.log"
+    handler = QueuedFileHandler(file, fsync_interval=60.0)
+    for i in range(1000):
+        handler.log(f"{BColors.WARN}line {i}{BColors.ENDC}\n")
+    handler.flush()
+    lines = file.read_text(encoding="utf-8").splitlines()
+    assert lines[1:] == [f"line {i}" for i in range(1000)]
+    assert handler.dropped == 0
+    handler.close()
+    assert file.read_text(encoding="utf-8").rstrip().splitlines()[-1].startswith("Log file closed")
+
+
+def test_queued_handler_ignores_after_close(tmp_path: Path) -> None:
+    handler = QueuedFileHandler(tmp_path / "drop.log", maxsize=1, overflow="drop-newest")
+    handler.close()
+    handler.log("after close\n")
+    assert handler.dropped == 0
+    assert "after close" not in (tmp_path / "drop.log").read_text(encoding="utf-8")
+
+
+class ListHandler(IHandler):
+    def __init__(self, *, ansi: bool) -> None:
+        self.ansi = ansi
+        self.messages: list[str] = []
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self.messages.append(msg)
+
+    def flush(self) -> None: ...
+
+
+def test_dispatch_strips_only_for_plain_handlers() -> None:
+    coloured, plain = ListHandler(ansi=True), ListHandler(ansi=False)
+    dispatch([coloured, plain], f"{BColors.FAIL}x{BColors.ENDC}\r")
+    assert coloured.messages == [f"{BColors.FAIL}x{BColors.ENDC}\r"]
+    assert plain.messages == ["x\n"]
+
+
+def test_rotating_handler_compresses_and_prunes(tmp_path: Path) -> None:
+    file = tmp_path / "run.log"
+    handler = RotatingFileHandler(file, max_bytes=200, backup_count=3, compress="gz")
+    for i in range(100):
+        handler.log(f"{BColors.OKGREEN}line {i:04d}{BColors.ENDC}\n")
+    handler.close()
+    segments = sorted(tmp_path.glob("run.*.log.gz"))
+    assert len(segments) == 3
+    assert not list(tmp_path.glob("run.*.log"))
+    last = gzip.decompress(segments[-1].read_bytes()).decode()
+    assert "\033" not in last
+    assert "line 0099" in file.read_text(encoding="utf-8") + last
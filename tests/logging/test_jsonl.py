@@ -0,0 +1,41 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytools.logging import JSONLHandler, iter_log_records
+from pytools.logging._struct_logger import StructLogger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytools.logging._jsonl import RecordFormat
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "binary"])
+def test_round_trip(tmp_path: Path, fmt: RecordFormat) -> None:
+    file = tmp_path / f"log.{fmt}"
+    logger = StructLogger("DEBUG", stdout=False)
+    logger.add_handler(JSONLHandler(file, fmt=fmt), name="json")
+    for i in range(10):
+        logger.debug("step\nwith newline", i=i, values=(i, i + 1))
+    logger.warn("done")
+    logger.disp("plain text")
+    logger.close()
+
+    records = list(iter_log_records(file))
+    assert len(records) == 12
+    assert records[0]["msg"] == "step\nwith newline"
+    assert records[0]["values"] == [0, 1]
+    assert records[0]["function"] == "test_round_trip"
+    assert records[-1]["level"] is None
+
+    warnings = list(iter_log_records(file, level="WARN"))
+    assert [r["msg"] for r in warnings] == ["done"]
+    assert [r["i"] for r in iter_log_records(file, where={"i": 7})] == [7]
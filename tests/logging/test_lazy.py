@@ -0,0 +1,53 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+from pytools.logging import IHandler, Lazy, LogEnum
+from pytools.logging._struct_logger import StructLogger
+
+
+class ListHandler(IHandler):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self.messages.append(msg)
+
+    def flush(self) -> None: ...
+
+
+def test_lazy_skipped_below_level() -> None:
+    calls: list[int] = []
+
+    def expensive() -> str:
+        calls.append(1)
+        return "expensive"
+
+    handler = ListHandler()
+    logger = StructLogger("WARN", stdout=False)
+    logger.add_handler(handler)
+    logger.debug(Lazy(expensive))
+    logger.info(lambda: expensive().upper())
+    assert calls == []
+    assert handler.messages == []
+    assert not logger.is_enabled_for(LogEnum.INFO)
+    assert logger.is_enabled_for(LogEnum.ERROR)
+
+
+def test_lazy_rendered_when_enabled() -> None:
+    handler = ListHandler()
+    logger = StructLogger("DEBUG", stdout=False, header=False)
+    logger.add_handler(handler)
+    logger.brief(Lazy("x = {}, y = {y}", 1, y=[1, 2]))
+    logger.brief(lambda: {"a": 1})
+    assert handler.messages == ["x = 1, y = [1, 2]\n", "{a: 1}\n"]
+
+
+def test_no_handlers_disables_logger() -> None:
+    logger = StructLogger("DEBUG", stdout=False)
+    assert not logger.is_enabled_for(LogEnum.FATAL)
@@ -0,0 +1,88 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from pytools.logging import (
+    IHandler,
+    ScopeStats,
+    profile_report,
+    profile_stats,
+    reset_profile,
+    scope,
+)
+from pytools.logging._profile import ProfileSnapshot
+from pytools.logging._struct_logger import StructLogger
+
+
+class ListHandler(IHandler):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self.messages.append(msg)
+
+    def flush(self) -> None: ...
+
+
+@pytest.fixture(autouse=True)
+def clean_profile() -> None:
+    reset_profile()
+
+
+@scope("inner")
+def inner() -> None: ...
+
+
+def outer() -> None:
+    with scope("outer"):
+        for _ in range(3):
+            inner()
+
+
+def test_nested_scopes_across_threads() -> None:
+    threads = [threading.Thread(target=outer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    outer()
+    stats = profile_stats()
+    assert set(stats) == {("outer",), ("outer", "inner")}
+    assert stats["outer",].count == 5
+    assert stats["outer", "inner"].count == 15
+    assert stats["outer",].total >= stats["outer", "inner"].total
+
+
+def test_snapshot_merges_into_parent() -> None:
+    child = ScopeStats()
+    for t in (1.0, 2.0, 3.0):
+        child.add(t)
+    ProfileSnapshot({("work",): child}).apply()
+    ProfileSnapshot({("work",): child}).apply()
+    stats = profile_stats()["work",]
+    assert stats.count == 6
+    assert stats.total == pytest.approx(12.0)
+    assert (stats.min, stats.max) == (1.0, 3.0)
+    assert stats.percentile(50) == 2.0
+
+
+def test_report_is_a_tree() -> None:
+    outer()
+    handler = ListHandler()
+    logger = StructLogger("INFO", stdout=False)
+    logger.add_handler(handler)
+    profile_report(logger, reset=True)
+    lines = "".join(handler.messages).splitlines()
+    assert lines[1].startswith("scope")
+    assert lines[2].startswith("outer ")
+    assert lines[3].startswith("  inner ")
+    assert profile_stats() == {}
@@ -0,0 +1,154 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytools.logging import IHandler, get_logger, profile_stats, reset_profile, scope
+from pytools.parallel import ThreadedRunner, parallel_exec
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytools.parallel import ThreadMethods
+
+
+class ListHandler(IHandler):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def __del__(self) -> None: ...
+
+    def log(self, msg: str) -> None:
+        self.messages.append(msg)
+
+    def flush(self) -> None: ...
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.n = 0
+
+    def next(self) -> None:
+        self.n += 1
+
+
+def work(i: int) -> int:
+    get_logger().info(f"message from task {i}")
+    return i
+
+
+@pytest.mark.parametrize("backend", [{"thread": 2}, {"core": 2}])
+def test_worker_logs_reach_parent(backend: ThreadMethods) -> None:
+    handler = ListHandler()
+    logger = get_logger("__main__", level="INFO")
+    logger.add_handler(handler, name="test")
+    try:
+        with ThreadedRunner(**backend) as runner:
+            for i in range(4):
+                runner.submit(work, i)
+    finally:
+        logger.remove_handler("test")
+    text = "".join(handler.messages)
+    for i in range(4):
+        assert f"message from task {i}" in text
+
+
+@scope("task")
+def profiled(i: int) -> int:
+    return i
+
+
+def test_worker_profile_reaches_parent() -> None:
+    reset_profile()
+    with ThreadedRunner(core=2) as runner:
+        for i in range(4):
+            runner.submit(profiled, i)
+    assert profile_stats()["task",].count == 4
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+@pytest.mark.parametrize("backend", [{"thread": 2}, {"core": 2}])
+def test_map_preserves_order(backend: ThreadMethods) -> None:
+    with ThreadedRunner(**backend) as runner:
+        assert runner.map(square, range(1000)) == [x * x for x in range(1000)]
+        assert sorted(runner.imap_unordered(square, range(100), chunksize=7)) == [
+            x * x for x in range(100)
+        ]
+
+
+def test_imap_keeps_a_bounded_window() -> None:
+    consumed: list[int] = []
+
+    def source() -> Iterator[int]:
+        for i in range(10_000):
+            consumed.append(i)
+            yield i
+
+    with ThreadedRunner(thread=2) as runner:
+        results = runner.imap(square, source(), chunksize=10, window=3)
+        assert next(results) == 0
+        assert len(consumed) <= 4 * 10
+        results.close()
+
+
+def test_parallel_exec_bounds_jobs_in_flight() -> None:
+    consumed: list[int] = []
+    outstanding = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def job(i: int) -> None:
+        nonlocal outstanding
+        with lock:
+            outstanding -= 1
+        time.sleep(0.001 * (i % 3))
+
+    def source() -> Iterator[tuple[tuple[int], dict[str, object]]]:
+        nonlocal outstanding, peak
+        for i in range(200):
+            consumed.append(i)
+            with lock:
+                outstanding += 1
+                peak = max(peak, outstanding)
+            yield (i,), {}
+
+    with futures.ThreadPoolExecutor(4) as exe:
+        parallel_exec(exe, job, source(), prog_bar=Counter(), max_inflight=5)
+    assert len(consumed) == 200
+    assert peak <= 5
+
+
+def test_runner_submit_blocks_at_max_inflight() -> None:
+    started = threading.Semaphore(0)
+    release = threading.Event()
+
+    def wait(i: int) -> int:
+        started.release()
+        release.wait()
+        return i
+
+    bar = Counter()
+    with ThreadedRunner(thread=4, max_inflight=2, prog_bar=bar) as runner:
+        runner.submit(wait, 0)
+        runner.submit(wait, 1)
+        producer = threading.Thread(target=runner.submit, args=(wait, 2))
+        producer.start()
+        assert started.acquire(timeout=1)
+        assert started.acquire(timeout=1)
+        producer.join(0.1)
+        assert producer.is_alive()
+        release.set()
+        producer.join()
+    assert bar.n == 3
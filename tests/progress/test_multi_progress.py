@@ -0,0 +1,47 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+import io
+
+from pytools.progress import MultiProgress, ProgressReader
+
+
+class TTY(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+def test_summary_lines_without_tty() -> None:
+    out = io.StringIO()
+    with MultiProgress(2, interval=0.01, summary_interval=3600.0, stream=out) as multi:
+        first, second = multi.task("first", 100), multi.task("second", 100)
+        first.update(100)
+        first.finish()
+        second.update(50)
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 1
+    assert "75.0%" in lines[0]
+    assert "[1/2 done, 1 running]" in lines[0]
+    assert "\033[" not in lines[0]
+
+
+def test_redraws_active_tasks_in_place() -> None:
+    out = TTY()
+    multi = MultiProgress(2, stream=out)
+    task = multi.task("archive", 4096)
+    multi.task("pending", 10)
+    with multi:
+        data = ProgressReader(io.BytesIO(b"x" * 1024), task).read()
+    assert len(data) == task.done == 1024
+    with multi:
+        task.finish()
+    first, second = out.getvalue().split("\033[J")[:2]
+    assert "archive" in first
+    assert "pending" not in first
+    assert first.count("\n") == 2
+    assert second.startswith("\033[2F")
+    assert "archive" not in second
@@ -0,0 +1,36 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pytools.progress import ProgressBar
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_render_is_throttled(capsys: pytest.CaptureFixture[str]) -> None:
+    bar = ProgressBar(100_000, interval=60.0)
+    for _ in range(100_000):
+        bar.next()
+    frames = capsys.readouterr().out.split("\r")
+    # Only the final frame, as the interval never elapses.
+    assert len([f for f in frames if f]) == 1
+    assert frames[-1].startswith("|" + "*" * 50 + "|100.0%")
+    assert frames[-1].endswith("\n")
+
+
+def test_update_advances_in_batches(capsys: pytest.CaptureFixture[str]) -> None:
+    bar = ProgressBar(10, end="\n", interval=0.0)
+    for _ in range(5):
+        bar.update(2)
+    assert bar.i == 10
+    assert bar.rate > 0
+    assert bar.eta == 0
+    lines = [line for line in capsys.readouterr().out.splitlines() if line]
+    assert lines[-1].startswith("|" + "*" * 50 + "|100.0%")
+    assert "it/s ETA 00:00" in lines[-1]
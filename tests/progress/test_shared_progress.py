@@ -0,0 +1,47 @@
+# /// script
+# dependencies = [
+#     "pytools
+# ]
+# ///
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytools.parallel import ThreadedRunner
+from pytools.progress import SharedProgress, job_progress, progress_job
+
+if TYPE_CHECKING:
+    from pytools.parallel import ThreadMethods
+
+
+def work(parts: int) -> int:
+    job = job_progress(parts)
+    for _ in range(parts):
+        job.advance()
+    return parts
+
+
+def test_job_steps_roll_up() -> None:
+    progress = SharedProgress(2, interval=60.0)
+    with progress:
+        with progress_job() as job:
+            job.parts = 4
+            for _ in range(3):
+                job.advance()
+            assert progress.done == pytest.approx(0.75)
+        assert progress.done == 1.0
+        with progress_job():
+            pass
+        assert progress.done == 2.0
+    assert job_progress(3).parts == 1
+
+
+@pytest.mark.parametrize("backend", [{"thread": 2}, {"core": 2}])
+def test_workers_advance_shared_bar(backend: ThreadMethods) -> None:
+    progress = SharedProgress(6, interval=0.01)
+    with ThreadedRunner(prog_bar=progress, **backend) as runner:
+        for parts in range(6):
+            runner.submit(work, parts * 100)
+    assert progress.done == 6.0